@@ -1,5 +1,4 @@
 import os
-import logging
 
 class Config:
     def __init__(self):
@@ -13,10 +12,21 @@ class Config:
         
         self.environment = os.getenv("ENVIRONMENT", "development")
         self.is_production = self.environment == "production"
+        self.is_cloud_run = bool(os.getenv("K_SERVICE"))
         
         # Database
         self.mongo_uri = os.getenv("MONGO_URI")
         self.db_name = os.getenv("DB_NAME", "char")
+        # Connection pool, sized for a single small Cloud Run/Render instance
+        self.mongo_max_pool_size = int(os.getenv("MONGO_MAX_POOL_SIZE", "20"))
+        self.mongo_min_pool_size = int(os.getenv("MONGO_MIN_POOL_SIZE", "2"))
+        self.mongo_max_idle_time_ms = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "30000"))
+        self.mongo_wait_queue_timeout_ms = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "5000"))
+        self.mongo_server_selection_timeout_ms = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+        self.mongo_compressors = os.getenv("MONGO_COMPRESSORS", "zstd,zlib")
+        # Threads behind asyncio.to_thread, which wraps the blocking
+        # Leonardo/Meshy HTTP calls; these wait on the network, not the CPU
+        self.default_executor_workers = int(os.getenv("DEFAULT_EXECUTOR_WORKERS", "32"))
         
         # Required APIs
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
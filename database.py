@@ -1,36 +1,91 @@
-import os
-from motor.motor_asyncio import AsyncIOMotorClient
-from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import IndexModel
+from typing import Optional
 import logging
 from config import config
 logger = logging.getLogger(__name__)
 
-load_dotenv()
-
 MONGO_URI = config.mongo_uri
 DB_NAME = config.db_name
 
-client = AsyncIOMotorClient(MONGO_URI)
-database = client[DB_NAME]
+client: Optional[AsyncIOMotorClient] = None
+
+
+def get_client() -> AsyncIOMotorClient:
+    """Get the shared Motor client, creating it on first use."""
+    global client
+    if client is None:
+        client = AsyncIOMotorClient(
+            MONGO_URI,
+            maxPoolSize=config.mongo_max_pool_size,
+            minPoolSize=config.mongo_min_pool_size,
+            maxIdleTimeMS=config.mongo_max_idle_time_ms,
+            waitQueueTimeoutMS=config.mongo_wait_queue_timeout_ms,
+            serverSelectionTimeoutMS=config.mongo_server_selection_timeout_ms,
+            compressors=config.mongo_compressors,
+        )
+    return client
+
+
+def get_database():
+    return get_client()[DB_NAME]
+
+
+class LazyCollection:
+    """Collection handle that resolves against the shared client on first use,
+    so importing this module does not open a connection pool."""
 
-character_collection = database.get_collection("characters")
-asset_collection = database.get_collection("assets")
-generation_collection = database.get_collection("generations")
+    def __init__(self, name: str):
+        self._name = name
+        self._collection: Optional[AsyncIOMotorCollection] = None
 
+    def _resolve(self) -> AsyncIOMotorCollection:
+        if self._collection is None:
+            self._collection = get_database()[self._name]
+        return self._collection
 
-cache_collection = database["asset_cache"]
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+
+character_collection = LazyCollection("characters")
+asset_collection = LazyCollection("assets")
+generation_collection = LazyCollection("generations")
+
+
+cache_collection = LazyCollection("asset_cache")
 
 async def connect_to_mongo():
     try:
-        await client.admin.command('ping')
-        print("Connected to MongoDB!")
-    except Exception as e:
-        print(f"Failed to connect to MongoDB: {e}")
-        raise e
+        await get_client().admin.command('ping')
+        logger.info("Connected to MongoDB")
+    except Exception:
+        logger.exception("Failed to connect to MongoDB")
+        raise
+
+def close_mongo_connection():
+    if client is not None:
+        client.close()
 
-async def setup_cache_indexes():
-    """Set up indexes for the cache collection"""
+async def setup_indexes():
+    """Set up indexes for the hot query fields and the cache collection"""
     try:
+        # Asset list/search filters
+        await asset_collection.create_indexes([
+            IndexModel([("type", 1), ("gen", 1)]),
+            IndexModel([("subcategory", 1)]),
+            # Typed listings, newest first: page order and the keyset
+            # cursor walk (untyped listings use the _id index)
+            IndexModel([("type", 1), ("_id", -1)]),
+        ])
+        await character_collection.create_index("faction_id")
+
+        # Generation lookups by character and by Meshy task
+        await generation_collection.create_indexes([
+            IndexModel([("character_id", 1)]),
+            IndexModel([("meshy.meshy_id", 1)], sparse=True),
+        ])
+
         # TTL index for automatic expiration
         await cache_collection.create_index(
             "expires_at", 
@@ -40,6 +95,6 @@ async def setup_cache_indexes():
         # Index on cache_key for fast lookups
         await cache_collection.create_index("cache_key", unique=True)
         
-        logging.info("Cache indexes created successfully")
+        logger.info("Database indexes created successfully")
     except Exception as e:
-        logging.error(f"Error creating cache indexes: {e}")
+        logger.error(f"Error creating database indexes: {e}")
@@ -1,29 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from routes import api_router 
 from services.background_polling import meshy_polling_service
-import os
+from database import get_client, close_mongo_connection, setup_indexes
+from config import config
+from utils.compression import SelectiveGZipMiddleware
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # The stock default executor has min(32, cpu + 4) threads, which a few
+    # slow provider calls can fill on a small instance
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(
+        max_workers=config.default_executor_workers, thread_name_prefix="blocking"
+    ))
+    get_client()
+    await setup_indexes()
     await meshy_polling_service.start_polling()
     yield
     await meshy_polling_service.stop_polling()
+    close_mongo_connection()
 
-app = FastAPI(lifespan=lifespan, title="Character Creator API")
+app = FastAPI(
+    lifespan=lifespan,
+    title="Character Creator API",
+    default_response_class=ORJSONResponse
+)
+
+ALLOWED_ORIGINS = frozenset({
+    "http://localhost:3000",
+    "https://pikselplay.netlify.app",
+    "https://char-ui.vercel.app",
+})
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", "https://pikselplay.netlify.app", "https://char-ui.vercel.app"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=3600,  # Let browsers cache preflight responses for an hour
 )
 
+# Asset pages are large, repetitive JSON; compress anything over 1KB.
+# Images are served as-is, gzip can't shrink them.
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 app.include_router(api_router, prefix="", tags=["Char"])
 
 @app.get("/health")
@@ -35,28 +63,19 @@ async def health_check():
         raise HTTPException(status_code=503, detail=f"Service unhealthy: {str(e)}")
 
 def refresh_environment():
-    """Force refresh environment variables on Cloud Run."""
-    try:
-        # Check if we're on Cloud Run
-        if os.getenv('K_SERVICE'):
-            logger.info("🏃 Running on Google Cloud Run")
-            
-            # Force reload environment variables
-            import subprocess
-            result = subprocess.run(['env'], capture_output=True, text=True)
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if '=' in line and 'OPENAI_API_KEY' in line:
-                        key, value = line.split('=', 1)
-                        os.environ[key] = value
-                        logger.info(f"✅ Refreshed {key} from environment")
-            
-    except Exception as e:
-        logger.warning(f"Could not refresh environment: {e}")
+    """Report the environment the service is running in on Cloud Run."""
+    # Cloud Run injects variables into os.environ before the process starts,
+    # so there is nothing to reload - just log what config picked up.
+    if config.is_cloud_run:
+        logger.info("🏃 Running on Google Cloud Run")
+        if config.openai_api_key:
+            logger.info("✅ OPENAI_API_KEY present in environment")
+        else:
+            logger.warning("OPENAI_API_KEY missing from environment")
 
 # Call this before any imports that use environment variables
 refresh_environment()
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8080, loop="uvloop", http="httptools")
\ No newline at end of file
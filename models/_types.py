@@ -0,0 +1,83 @@
+from typing import Any, Annotated
+from datetime import datetime, timezone
+from functools import partial
+from pydantic import PlainValidator, PlainSerializer, WithJsonSchema
+from bson import ObjectId
+from bson.binary import Binary
+import numpy as np
+
+
+def _validate_object_id(v: Any) -> ObjectId:
+    # Strings dominate the API surface, so check them first. Decode the hex
+    # once and build from the 12 raw bytes, instead of ObjectId(str)
+    # re-validating the string we just checked.
+    if isinstance(v, str) and len(v) == 24:
+        try:
+            raw = bytes.fromhex(v)
+        except ValueError:
+            raw = b""
+        # fromhex skips spaces, so a padded string can decode short
+        if len(raw) == 12:
+            return ObjectId(raw)
+    elif isinstance(v, ObjectId):
+        return v
+    raise ValueError("Invalid ObjectId")
+
+
+# A plain ObjectId on the model, validated from either an ObjectId or its
+# 24-char hex string and serialized to JSON as that string.
+PydanticObjectId = Annotated[
+    ObjectId,
+    PlainValidator(_validate_object_id),
+    PlainSerializer(str, return_type=str, when_used='json'),
+    WithJsonSchema({"type": "string"}),
+]
+
+
+# Timezone-aware replacement for the deprecated datetime.utcnow(), bound
+# once so default_factory calls straight into C without a Python frame
+utcnow = partial(datetime.now, timezone.utc)
+
+
+# BSON binData subtype 9 with the FLOAT32 dtype header, the packed vector
+# format Atlas Vector Search indexes alongside plain arrays of doubles.
+VECTOR_SUBTYPE = 9
+FLOAT32_HEADER = b"\x27\x00"
+
+
+def pack_vector(values) -> Binary:
+    """Pack a sequence of floats into a BSON float32 vector."""
+    array = np.asarray(values, dtype="<f4")
+    if array.ndim != 1:
+        raise ValueError("Vector must be one-dimensional")
+    return Binary(FLOAT32_HEADER + array.tobytes(), VECTOR_SUBTYPE)
+
+
+def unpack_vector(value) -> np.ndarray:
+    """Decode a stored vector, either packed binData or a legacy list of floats."""
+    if isinstance(value, Binary) and value.subtype == VECTOR_SUBTYPE:
+        return np.frombuffer(value, dtype="<f4", offset=len(FLOAT32_HEADER))
+    return np.asarray(value, dtype=np.float32)
+
+
+def _validate_vector(value: Any) -> Binary:
+    if isinstance(value, Binary) and value.subtype == VECTOR_SUBTYPE:
+        return value
+    try:
+        return pack_vector(value)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid vector, expected a list of floats")
+
+
+def _serialize_vector(value: Binary) -> list:
+    return unpack_vector(value).tolist()
+
+
+# Stored in Mongo as a packed float32 blob (~4 bytes per dimension instead of
+# a BSON double plus index key per element), serialized to JSON as a list.
+Float32Vector = Annotated[
+    Any,
+    PlainValidator(_validate_vector),
+    PlainSerializer(_serialize_vector, when_used='json'),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
@@ -1,29 +1,12 @@
-from typing import List, Optional, Any
-from pydantic import BaseModel, Field, ConfigDict, GetCoreSchemaHandler
-from datetime import datetime
-from bson import ObjectId
-from pydantic_core import core_schema
+from functools import lru_cache
+from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict, field_serializer
+from datetime import datetime, timezone
+from models._types import PydanticObjectId, Float32Vector, utcnow
 
-class PydanticObjectId(ObjectId):
-    @classmethod
-    def __get_pydantic_core_schema__(
-        cls, 
-        _source_type: Any, 
-        _handler: GetCoreSchemaHandler
-    ) -> core_schema.CoreSchema:
-        return core_schema.union_schema([
-            core_schema.is_instance_schema(ObjectId),
-            core_schema.chain_schema([
-                core_schema.str_schema(),
-                core_schema.no_info_plain_validator_function(cls.validate),
-            ]),
-        ])
 
-    @classmethod
-    def validate(cls, v: str) -> ObjectId:
-        if not ObjectId.is_valid(v):
-            raise ValueError("Invalid ObjectId")
-        return ObjectId(v)
+def isoformat_seconds(dt: datetime) -> str:
+    return dt.isoformat(timespec='seconds')
 
 
 class AssetMetadata(BaseModel):
@@ -37,28 +20,30 @@ class AssetBase(BaseModel):
     name: str
     gen: str 
     description: Optional[str] = None
-    description_vector: Optional[List[float]] = None
+    description_vector: Optional[Float32Vector] = None
     image_url: Optional[str] = None
     image_data: Optional[bytes] = None 
-    image_embedding: Optional[List[float]] = None
+    image_embedding: Optional[Float32Vector] = None
     metadata: Optional[AssetMetadata] = None
     
     model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str, datetime: lambda dt: dt.isoformat(timespec='seconds')}
+        arbitrary_types_allowed=True
     )
 
 
 class AssetDB(AssetBase):
     # id: PydanticObjectId = Field(default_factory=ObjectId, alias="_id") # Using _id directly from mongo
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
     
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str, datetime: lambda dt: dt.isoformat(timespec='seconds')},
         populate_by_name=True # Allows using alias, e.g. if we had id = Field(alias="_id")
     )
 
+    @field_serializer('created_at', when_used='json')
+    def serialize_created_at(self, dt: datetime) -> str:
+        return isoformat_seconds(dt)
+
 
 class AssetCreate(AssetBase):
     # For creation, we might not expect base64 data directly, image_data (bytes) would be used
@@ -73,13 +58,19 @@ class AssetResponse(AssetBase):
     image_data_base64: Optional[str] = None
     image_content_type: Optional[str] = None
 
-    # Explicitly exclude the raw bytes data from the response model
+    # Stored image size and dimensions, recorded when the image is saved
+    image_size_bytes: Optional[int] = None
+    image_width: Optional[int] = None
+    image_height: Optional[int] = None
+
+    # Explicitly exclude the raw bytes data and embeddings from the response model
     image_data: Optional[bytes] = Field(None, exclude=True)
+    description_vector: Optional[Float32Vector] = Field(None, exclude=True)
+    image_embedding: Optional[Float32Vector] = Field(None, exclude=True)
     
     model_config = ConfigDict(
         from_attributes=True, # Renamed from orm_mode in Pydantic v2
         populate_by_name=True, # Allows mapping _id to id
-        json_encoders={ObjectId: str, datetime: lambda dt: dt.isoformat(timespec='seconds')+"Z"}, # Ensure ISO format with Z
         json_schema_extra={
             "example": {
                 "id": "60d21b4967d0d8992e610c87", # Example output remains a string
@@ -96,15 +87,44 @@ class AssetResponse(AssetBase):
                     "compatible_with": ["female", "elf"]
                 },
                 "created_at": "2023-05-14T00:00:00Z",
-                # description_vector and image_embedding are omitted as they are optional
-                # and likely large for a list response.
+                # description_vector and image_embedding are never serialized
+                # as they are large and only used server-side.
             }
         }
     )
 
+    @classmethod
+    def from_mongo(cls, doc: dict):
+        """Build from a trusted Mongo document, skipping field validation.
+        Documents missing a required field are validated, and rejected, as before."""
+        if not cls._required_keys() <= doc.keys():
+            return cls.model_validate(doc)
+        if isinstance(doc.get('metadata'), dict):
+            doc = {**doc, 'metadata': AssetMetadata.model_construct(**doc['metadata'])}
+        return cls.model_construct(**doc)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _required_keys(cls) -> frozenset:
+        return frozenset(
+            field.alias or name for name, field in cls.model_fields.items() if field.is_required()
+        )
+
+    @field_serializer('created_at', when_used='json')
+    def serialize_created_at(self, dt: datetime) -> str:
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return isoformat_seconds(dt) + "Z" # Ensure ISO format with Z
+
 class PaginatedAssetResponse(BaseModel):
     assets: List[AssetResponse]
-    total_assets: int
-    total_pages: int
-    current_page: int
-    page_size: int
\ No newline at end of file
+    # Only counted for cursor requests when include_total is set
+    total_assets: Optional[int] = None
+    total_pages: Optional[int] = None
+    # Not set on cursor requests, which have no page number
+    current_page: Optional[int] = None
+    page_size: int
+    # False for metadata-only pages; images are then loaded via /image/{asset_id}
+    include_images: bool = False
+    # _id of the last asset, pass as `after` to fetch the next page
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -1,30 +1,8 @@
-from typing import List, Optional, Any, Dict, ClassVar, Annotated
-from pydantic import BaseModel, Field, ConfigDict, BeforeValidator, GetCoreSchemaHandler
+from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 from bson import ObjectId
-from pydantic_core import core_schema
-
-# Better ObjectId handling for Pydantic v2
-class PydanticObjectId(ObjectId):
-    @classmethod
-    def __get_pydantic_core_schema__(
-        cls, 
-        _source_type: Any, 
-        _handler: GetCoreSchemaHandler
-    ) -> core_schema.CoreSchema:
-        return core_schema.union_schema([
-            core_schema.is_instance_schema(ObjectId),
-            core_schema.chain_schema([
-                core_schema.str_schema(),
-                core_schema.no_info_plain_validator_function(cls.validate),
-            ]),
-        ])
-
-    @classmethod
-    def validate(cls, v: str) -> ObjectId:
-        if not ObjectId.is_valid(v):
-            raise ValueError("Invalid ObjectId")
-        return ObjectId(v)
+from models._types import PydanticObjectId, Float32Vector, utcnow
 
 
 class CharacterAttributes(BaseModel):
@@ -40,33 +18,31 @@ class CharacterBase(BaseModel):
     type: Optional[str] = None
     description: Optional[str] = None
     faction_id: Optional[PydanticObjectId] = None
-    description_vector: Optional[List[float]] = None
+    description_vector: Optional[Float32Vector] = None
     
     # Avatar images and embeddings
     avatar_url: Optional[str] = None
-    avatar_embedding: Optional[List[float]] = None
+    avatar_embedding: Optional[Float32Vector] = None
     body_url: Optional[str] = None
-    body_embedding: Optional[List[float]] = None
+    body_embedding: Optional[Float32Vector] = None
     transparent_url: Optional[str] = None
-    transparent_embedding: Optional[List[float]] = None
+    transparent_embedding: Optional[Float32Vector] = None
     
     # Attributes
     attributes: Optional[CharacterAttributes] = None
     
     model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str}
+        arbitrary_types_allowed=True
     )
 
 
 class CharacterDB(CharacterBase):
     id: PydanticObjectId = Field(default_factory=ObjectId, alias="_id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
     creator_user_id: Optional[PydanticObjectId] = None
     
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str},
         populate_by_name=True
     )
 
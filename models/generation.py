@@ -1,76 +1,53 @@
-from typing import List, Optional, Any
-from pydantic import BaseModel, Field, ConfigDict, GetCoreSchemaHandler
+from functools import lru_cache
+from typing import List, Optional, Any, Literal
+from typing_extensions import NotRequired, Required, TypedDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator
 from datetime import datetime
-from bson import ObjectId
-from pydantic_core import core_schema
+from models._types import PydanticObjectId, Float32Vector, utcnow
 
-class PydanticObjectId(ObjectId):
-    @classmethod
-    def __get_pydantic_core_schema__(
-        cls, source_type: Any, handler: GetCoreSchemaHandler
-    ) -> core_schema.CoreSchema:
-        return core_schema.json_or_python_schema(
-            json_schema=core_schema.str_schema(),
-            python_schema=core_schema.union_schema([
-                core_schema.is_instance_schema(ObjectId),
-                core_schema.chain_schema([
-                    core_schema.str_schema(),
-                    core_schema.no_info_plain_validator_function(cls.validate),
-                ])
-            ]),
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                lambda x: str(x)
-            ),
-        )
+# Shared by every generation model; ObjectId serialization is handled by
+# the PydanticObjectId annotation, so no json_encoders are needed.
+_COMMON_CONFIG = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
+# Leaf models that are built once and only read afterwards
+_FROZEN_CONFIG = ConfigDict(**_COMMON_CONFIG, frozen=True)
 
-    @classmethod
-    def validate(cls, v):
-        if not ObjectId.is_valid(v):
-            raise ValueError("Invalid ObjectId")
-        return ObjectId(v)
-
-class MeshyMetadata(BaseModel):
-    meshy_id: str
-    glb_url: Optional[str] = None
-    fbx_url: Optional[str] = None
-    usdz_url: Optional[str] = None
-    obj_url: Optional[str] = None
-    thumbnail_url: Optional[str] = None
-    texture_prompt: Optional[str] = None
-    texture_urls: Optional[List[dict[str, str]]] = None
-    task_error: Optional[dict[str, Any]] = None
-    progress: Optional[int] = None
-    status: Optional[str] = None
-    is_polling: Optional[bool] = False
-    last_polled: Optional[datetime] = None
-    polling_attempts: Optional[int] = 0
-
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str}
-    )
-    
-class UsedAssets(BaseModel):
+# Status values the background poller writes after mapping Meshy's own
+# PENDING/PROCESSING/SUCCEEDED/FAILED task states
+MeshyStatus = Literal["processing", "completed", "failed"]
+
+# Meshy task state, its texture URLs and the used-asset snapshots are plain
+# data carried between Mongo and the API, so they are TypedDicts rather than
+# nested models.
+class TextureInfo(TypedDict, total=False):
+    base_color: Optional[str]
+    metallic: Optional[str]
+    normal: Optional[str]
+    roughness: Optional[str]
+
+class MeshyMetadata(TypedDict, total=False):
+    meshy_id: Required[str]
+    glb_url: Optional[str]
+    fbx_url: Optional[str]
+    usdz_url: Optional[str]
+    obj_url: Optional[str]
+    thumbnail_url: Optional[str]
+    texture_prompt: Optional[str]
+    texture_urls: Optional[List[TextureInfo]]
+    task_error: Optional[dict[str, Any]]
+    progress: Optional[int]
+    status: Optional[MeshyStatus]
+    is_polling: Optional[bool]
+    last_polled: Optional[datetime]
+    polling_attempts: Optional[int]
+
+class UsedAssets(TypedDict):
     id: str
     name: str
     type: str
     subcategory: str
     description: str
     image_data: str
-    _id: Optional[str] = None
-    url: Optional[str] = None
-
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str}
-    )
-
-    def __init__(self, **data):
-        if 'id' in data and '_id' not in data:
-            data['_id'] = data['id']
-        elif '_id' in data and 'id' not in data:
-            data['id'] = data['_id']
-        super().__init__(**data)
+    url: NotRequired[Optional[str]]
 
 class GenerationBase(BaseModel):
     character_id: PydanticObjectId
@@ -78,29 +55,55 @@ class GenerationBase(BaseModel):
     image_url: Optional[str] = None
     description: Optional[str] = None
     used_assets: Optional[List[UsedAssets]] = None
-    description_vector: Optional[List[float]] = None
+    description_vector: Optional[Float32Vector] = None
     meshy: Optional[MeshyMetadata] = None
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=utcnow)
     is_3d_generating: Optional[bool] = False
     has_3d_model: Optional[bool] = False
 
+    model_config = _COMMON_CONFIG
+
+    @field_validator('used_assets', mode='before')
+    @classmethod
+    def _map_used_asset_ids(cls, used_assets: Any) -> Any:
+        """Older used_assets entries may only carry Mongo's _id."""
+        if not isinstance(used_assets, list):
+            return used_assets
+        return [
+            {**asset, 'id': str(asset['_id'])}
+            if isinstance(asset, dict) and 'id' not in asset and '_id' in asset
+            else asset
+            for asset in used_assets
+        ]
+
+    @classmethod
+    def from_mongo(cls, doc: dict):
+        """Build from a trusted Mongo document, skipping field validation.
+        Documents missing a required field are validated, and rejected, as before."""
+        if not cls._required_keys() <= doc.keys():
+            return cls.model_validate(doc)
+        if doc.get('used_assets'):
+            doc = {**doc, 'used_assets': cls._map_used_asset_ids(doc['used_assets'])}
+        return cls.model_construct(**doc)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _required_keys(cls) -> frozenset:
+        return frozenset(
+            field.alias or name for name, field in cls.model_fields.items() if field.is_required()
+        )
+
 class GenerationResponse(GenerationBase):
     id: PydanticObjectId = Field(alias="_id")
 
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str},
-        populate_by_name=True
-    )
+    model_config = _COMMON_CONFIG
 
 class Generation(GenerationResponse):
     # OpenAI embedding field (1536 dimensions)
-    embedding: Optional[List[float]] = Field(None, description="OpenAI vector embedding for semantic search")
+    embedding: Optional[Float32Vector] = Field(None, description="OpenAI vector embedding for semantic search")
     searchable_text: Optional[str] = Field(None, description="Preprocessed text for embedding generation")
     
-    class Config:
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
+    model_config = _COMMON_CONFIG
 
 class GenerationCreate(Generation):
     async def generate_embedding_data(self) -> tuple[str, List[float]]:
@@ -118,6 +121,15 @@ class GenerationSearchQuery(BaseModel):
     limit: int = Field(10, ge=1, le=50, description="Maximum number of results")
     min_score: float = Field(0.7, ge=0.0, le=1.0, description="Minimum similarity score (higher for OpenAI)")
 
+    model_config = _FROZEN_CONFIG
+
 class GenerationSearchResult(BaseModel):
     generation: Generation
-    score: float = Field(..., description="Similarity score (0-1)")
\ No newline at end of file
+    score: float = Field(..., description="Similarity score (0-1)")
+
+    model_config = _FROZEN_CONFIG
+
+# Built once at import; list endpoints validate and dump through these
+# instead of FastAPI's per-response encoding pass.
+GENERATION_LIST_ADAPTER = TypeAdapter(List[GenerationResponse])
+SEARCH_RESULT_LIST_ADAPTER = TypeAdapter(List[GenerationSearchResult])
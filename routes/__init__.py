@@ -1,20 +1,20 @@
 from fastapi import APIRouter
-from routes.asset import router as asset_router
-from routes.character import router as character_router
-from routes.leo import router as leo_router
-from routes.meshy import router as meshy_router
-from routes.generation import router as generation_router
-from routes.search import router as search_router
-from routes.asset_search import router as asset_search_router
-from routes.analyze import router as analyze_router
+import importlib
+
+# (prefix, module, tag) for every mounted router, in mount order
+ROUTES = [
+    ("/assets", "routes.asset", "Assets"),
+    ("/characters", "routes.character", "Characters"),
+    ("/leo", "routes.leo", "Leo"),
+    ("/meshy", "routes.meshy", "Meshy"),
+    ("/gen", "routes.generation", "Generations"),
+    ("/search", "routes.search", "Search"),
+    ("/asset-search", "routes.asset_search", "Asset Search"),
+    ("/analyze", "routes.analyze", "Analyze"),
+]
 
 api_router = APIRouter()
 
-api_router.include_router(asset_router, prefix="/assets", tags=["Assets"])
-api_router.include_router(character_router, prefix="/characters", tags=["Characters"])
-api_router.include_router(leo_router, prefix="/leo", tags=["Leo"])
-api_router.include_router(meshy_router, prefix="/meshy", tags=["Meshy"])
-api_router.include_router(generation_router, prefix="/gen", tags=["Generations"])
-api_router.include_router(search_router, prefix="/search", tags=["Search"])
-api_router.include_router(asset_search_router, prefix="/asset-search", tags=["Asset Search"])
-api_router.include_router(analyze_router, prefix="/analyze", tags=["Analyze"])
+for prefix, module_name, tag in ROUTES:
+    module = importlib.import_module(module_name)
+    api_router.include_router(module.router, prefix=prefix, tags=[tag])
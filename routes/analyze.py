@@ -1,23 +1,74 @@
 from fastapi import APIRouter, HTTPException, Form
 from services.image_analyze import analyze_image, analyze_with_gemini
 from fastapi import UploadFile, File
+from fastapi.responses import ORJSONResponse
 from typing import Optional
-from pydantic import BaseModel, Field
+from cachetools import TTLCache
+from pydantic import BaseModel, Field, ValidationError
 import logging
 import asyncio
-import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# The analyzer calls block on provider HTTP requests for up to two
+# minutes; give them their own bounded pool so they can't starve the
+# default executor that asyncio.to_thread calls share
+ANALYZER_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="analyzer")
+
+# Per-provider time budget in seconds; Groq answers in a few seconds, so a
+# hung Groq call shouldn't hold the response as long as the others
+ANALYZER_TIMEOUTS = {"groq": 60, "openai": 120, "gemini": 120}
+DEFAULT_ANALYZER_TIMEOUT = 120
+
+async def run_blocking(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(ANALYZER_EXECUTOR, partial(func, *args, **kwargs))
+
+def _dict_result_to_list(result: dict) -> list:
+    """Unwrap the first list value (e.g. {"assets": [...]}), else wrap the dict"""
+    if not result:
+        return []
+    return next((v for v in result.values() if isinstance(v, list)), [result])
+
+_RESULT_NORMALIZERS = {
+    list: lambda result: result,
+    dict: _dict_result_to_list,
+    type(None): lambda result: [],
+}
+
+def normalize_result(model_name: str, result) -> list:
+    """Coerce an analyzer's raw output into a list of detected assets"""
+    normalizer = _RESULT_NORMALIZERS.get(type(result))
+    if normalizer is None:
+        logger.warning(f"Unexpected result type from {model_name}: {type(result)}")
+        return []
+    return normalizer(result)
+
+# Successful analyzer output per (image sha256, model, caller's API key), so
+# re-analyzing the same upload doesn't pay for the provider calls again
+ANALYSIS_CACHE_MAXSIZE = 1000
+ANALYSIS_CACHE_TTL_SECONDS = 3600
+_analysis_cache: TTLCache = TTLCache(maxsize=ANALYSIS_CACHE_MAXSIZE, ttl=ANALYSIS_CACHE_TTL_SECONDS)
+
+
+def analysis_cache_key(digest: str, model_name: str, api_key: Optional[str]) -> tuple:
+    """Cache key for one model's analysis; the API key is kept only as a hash"""
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest() if api_key else None
+    return (digest, model_name, key_hash)
 
 class ModelConfig(BaseModel):
     enabled: bool = False  # Default to False
     apiKey: Optional[str] = None
 
 class AnalysisConfig(BaseModel):
-    openai: Optional[ModelConfig] = Field(default_factory=lambda: ModelConfig(enabled=False))
-    gemini: Optional[ModelConfig] = Field(default_factory=lambda: ModelConfig(enabled=False))
-    groq: Optional[ModelConfig] = Field(default_factory=lambda: ModelConfig(enabled=False))
+    openai: Optional[ModelConfig] = Field(default_factory=ModelConfig)
+    gemini: Optional[ModelConfig] = Field(default_factory=ModelConfig)
+    groq: Optional[ModelConfig] = Field(default_factory=ModelConfig)
     
     def model_post_init(self, __context):
         """Ensure all fields have default values if not provided"""
@@ -37,93 +88,82 @@ async def analyze_asset_image(
     Analyze an uploaded image using selected models based on configuration.
     Config parameter specifies which models to use and provides API keys if needed.
     """
-    contents = await file.read()
-    logging.info(f"Received file: {file.filename} of size {len(contents)} bytes")
-    temp_path = f"/tmp/{file.filename}"
-    with open(temp_path, "wb") as f:
-        f.write(contents)
-    
-    logging.info(f"Saved file to temporary path: {temp_path}")
-    logging.info(f"Received config: {config}")  # Debug log
+    logger.info(f"Received config: {config}")  # Debug log
 
     try:
-        config_dict = json.loads(config)
-        logging.info(f"Parsed config dict: {config_dict}")  # Debug log
-        
-        # Ensure all required fields exist with defaults
-        normalized_config = {
-            "openai": config_dict.get("openai", {"enabled": False}),
-            "gemini": config_dict.get("gemini", {"enabled": False}),
-            "groq": config_dict.get("groq", {"enabled": False})
-        }
-        
-        logging.info(f"Normalized config: {normalized_config}")  # Debug log
-        analysis_config = AnalysisConfig(**normalized_config)
-        
-    except json.JSONDecodeError as e:
-        logging.error(f"JSON decode error: {e}")
-        raise HTTPException(status_code=400, detail=f"Invalid JSON format: {str(e)}")
-    except Exception as e:
-        logging.error(f"Error parsing configuration: {e}")
-        logging.error(f"Config dict type: {type(config_dict)}")
-        logging.error(f"Config dict content: {config_dict}")
+        # Parse and validate in one pass; missing models fall back to the
+        # disabled defaults declared on AnalysisConfig
+        analysis_config = AnalysisConfig.model_validate_json(config)
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            logger.error(f"JSON decode error: {e}")
+            raise HTTPException(status_code=400, detail=f"Invalid JSON format: {str(e)}")
+        logger.error(f"Error parsing configuration: {e}")
         raise HTTPException(status_code=400, detail=f"Invalid configuration format: {str(e)}")
     
     # Check if at least one model is enabled
     if not any([analysis_config.openai.enabled, analysis_config.gemini.enabled, analysis_config.groq.enabled]):
         raise HTTPException(status_code=400, detail="At least one model must be enabled")
-    
+
+    # The analyzers take the image in memory, so it never touches disk
+    image_data = await file.read()
+    digest = hashlib.sha256(image_data).hexdigest()
+    logger.info(f"Received {file.filename} ({len(image_data)} bytes)")
+    return await _run_analysis(analysis_config, image_data, digest)
+
+async def _run_analysis(analysis_config: AnalysisConfig, image_data: bytes, digest: str) -> dict:
     tasks = []
-    async def run_blocking(func, *args, **kwargs):
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
-    
     results = {
         "groq": [],
         "openai": [],
         "gemini": []
     }
+
+    def queue(model_name: str, api_key: Optional[str], func, *args):
+        cache_key = analysis_cache_key(digest, model_name, api_key)
+        cached = _analysis_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached {model_name} analysis for {digest[:12]}")
+            results[model_name] = cached
+        else:
+            tasks.append((model_name, cache_key, run_blocking(func, *args, api_key)))
     
     # Only run analysis for enabled models
     if analysis_config.groq and analysis_config.groq.enabled:
         api_key = analysis_config.groq.apiKey if analysis_config.groq.apiKey else None
-        tasks.append(("groq", run_blocking(analyze_image, temp_path, "groq", api_key)))
+        queue("groq", api_key, analyze_image, image_data, "groq")
     
     if analysis_config.openai and analysis_config.openai.enabled:
         api_key = analysis_config.openai.apiKey if analysis_config.openai.apiKey else None
-        tasks.append(("openai", run_blocking(analyze_image, temp_path, "openai", api_key)))
+        queue("openai", api_key, analyze_image, image_data, "openai")
     
     if analysis_config.gemini and analysis_config.gemini.enabled:
         api_key = analysis_config.gemini.apiKey if analysis_config.gemini.apiKey else None
-        tasks.append(("gemini", run_blocking(analyze_with_gemini, temp_path, api_key)))
+        queue("gemini", api_key, analyze_with_gemini, image_data)
     
-    try:
-        for model_name, task in tasks:
-            try:
-                result = await asyncio.wait_for(task, timeout=120)
-                if isinstance(result, list):
-                    results[model_name] = result
-                elif isinstance(result, dict) and not result:
-                    results[model_name] = []
-                elif isinstance(result, dict):
-                    if any(isinstance(v, list) for v in result.values()):
-                        for v in result.values():
-                            if isinstance(v, list):
-                                results[model_name] = v
-                                break
-                    else:
-                        results[model_name] = [result]
-                else:
-                    results[model_name] = []
-                    logging.warning(f"Unexpected result type from {model_name}: {type(result)}")
-            except Exception as e:
-                logging.error(f"{model_name.capitalize()} analysis failed: {e}")
-                results[model_name] = []
-        
-    except asyncio.TimeoutError:
+    # Start every enabled model at once; each keeps its own timeout so a
+    # slow model only empties its own results.
+    outcomes = await asyncio.gather(
+        *(
+            asyncio.wait_for(task, timeout=ANALYZER_TIMEOUTS.get(model_name, DEFAULT_ANALYZER_TIMEOUT))
+            for model_name, _, task in tasks
+        ),
+        return_exceptions=True
+    )
+    for (model_name, cache_key, _), result in zip(tasks, outcomes):
+        if isinstance(result, Exception):
+            logger.error(f"{model_name.capitalize()} analysis failed: {result!r}")
+            results[model_name] = []
+        else:
+            results[model_name] = normalize_result(model_name, result)
+
+        # Failures and empty answers are retried on the next upload
+        if results[model_name]:
+            _analysis_cache[cache_key] = results[model_name]
+
+    # Nothing to return if every model that had to run timed out
+    timed_out = sum(isinstance(result, asyncio.TimeoutError) for result in outcomes)
+    if tasks and timed_out == len(tasks) and not any(results.values()):
         raise HTTPException(status_code=504, detail="Image analysis timed out")
-    except Exception as e:
-        logging.error(f"Unexpected error during analysis: {e}")
-        raise HTTPException(status_code=500, detail=f"Error during image analysis: {str(e)}")
 
     return results
\ No newline at end of file
@@ -1,25 +1,139 @@
-from fastapi import APIRouter, Body, HTTPException, status, Response, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Body, HTTPException, status, Request, Response, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List, Optional
 from services.asset_save import save_asset_with_vector, validate_asset, validate_asset_hybrid
 from models.asset import AssetCreate, AssetResponse, PaginatedAssetResponse
 from database import asset_collection
 from pydantic import BaseModel
 from bson import ObjectId
-import base64
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import ConnectionFailure
 import math
+import re
+import orjson
 import logging
-import io
-from PIL import Image
 import asyncio
-from datetime import datetime
-from utils.cached_batch import generate_cache_key, get_cached_batch, set_cached_batch
+from datetime import datetime, timezone
+from cachetools import LRUCache
+from services.image_processing import (
+    IMAGE_EXECUTOR, PREVIEW_MAX_WIDTH, PREVIEW_QUALITY,
+    build_preview, encode_base64, resize_and_encode, format_for_content_type
+)
+from utils.image_types import sniff_image_type
+from utils.cached_batch import generate_cache_key, get_cached_batch, set_cached_batch, clear_local_cache
 
 router = APIRouter()
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 cache_collection = None  
 
+IMAGE_CACHE_CONTROL = "public, max-age=86400"
+# Quality for /image thumbnails requested by width alone
+THUMBNAIL_DEFAULT_QUALITY = 75
+
+# Re-encoded listing thumbnails, keyed by asset version and encode settings.
+# updated_at is part of the key, so an edited image misses even in workers
+# that never saw the update.
+THUMBNAIL_CACHE_MAXSIZE = 2048
+_thumbnail_cache: LRUCache = LRUCache(maxsize=THUMBNAIL_CACHE_MAXSIZE)
+
+
+def evict_thumbnails(asset_id) -> None:
+    """Drop this worker's cached thumbnails for one asset"""
+    for key in [key for key in _thumbnail_cache if key[0] == asset_id]:
+        del _thumbnail_cache[key]
+
+# Stored alongside image_data and computed from it at save time
+IMAGE_DERIVED_FIELDS = (
+    "preview_data", "preview_content_type", "preview_checked_at",
+    "contentType", "image_size_bytes", "image_width", "image_height", "image_sha256",
+)
+
+# Large fields the API never returns, excluded at the query
+ASSET_RESPONSE_PROJECTION = {"image_data": 0, "preview_data": 0, "description_vector": 0, "image_embedding": 0}
+
+
+def listing_image_fields(include_images: bool, image_quality: int, max_image_width: Optional[int]) -> dict:
+    """Inclusion projection for the image fields a listing encodes from"""
+    if not include_images:
+        return {}
+    if (max_image_width, image_quality) == (PREVIEW_MAX_WIDTH, PREVIEW_QUALITY):
+        return {"preview_data": 1, "preview_content_type": 1, "updated_at": 1}
+    return {"image_data": 1, "contentType": 1, "updated_at": 1}
+
+
+# Fields every asset listing returns, whether paged by number or by cursor
+LISTING_FIELDS = {
+    "_id": 1,
+    "name": 1,
+    "type": 1,
+    "subcategory": 1,
+    "gen": 1,
+    "description": 1,
+    "image_url": 1,
+    "metadata": 1,
+    "image_size_bytes": 1,
+    "image_width": 1,
+    "image_height": 1,
+    "created_at": 1,
+}
+
+
+def listing_projection(include_images: bool, image_quality: int, max_image_width: Optional[int]) -> dict:
+    """Inclusion projection for a listing page: LISTING_FIELDS plus the image fields it encodes from"""
+    # Skip the largest field entirely for metadata-only listings
+    return {**LISTING_FIELDS, **listing_image_fields(include_images, image_quality, max_image_width)}
+
+
+async def load_missing_previews(docs: List[dict]) -> None:
+    """
+    Build previews for assets saved before previews were stored, and write
+    them back so each of those assets is decoded from its full image once.
+    Assets with no image, or one that can't be decoded, get a null preview
+    so later listings don't look them up again.
+    """
+    missing = [doc["_id"] for doc in docs if "preview_data" not in doc]
+    if not missing:
+        return
+    images = await asset_collection.find(
+        {"_id": {"$in": missing}}, {"image_data": 1, "contentType": 1, "updated_at": 1}
+    ).to_list(len(missing))
+    loop = asyncio.get_running_loop()
+
+    async def preview_for(image_doc: dict) -> dict:
+        if not image_doc.get("image_data"):
+            return {}
+        return await loop.run_in_executor(
+            IMAGE_EXECUTOR, build_preview, image_doc["image_data"],
+            image_doc.get("contentType") or sniff_image_type(image_doc["image_data"])
+        )
+
+    built = await asyncio.gather(*[preview_for(image_doc) for image_doc in images])
+    checked_at = datetime.now(timezone.utc)
+    previews = {
+        image_doc["_id"]: preview or {"preview_data": None, "preview_checked_at": checked_at}
+        for image_doc, preview in zip(images, built)
+    }
+    for doc in docs:
+        if doc["_id"] in previews:
+            doc.update(previews[doc["_id"]])
+
+    if previews:
+        # Derived data, so updated_at stays put; matching on it skips assets
+        # whose image was replaced while we were encoding
+        versions = {image_doc["_id"]: image_doc.get("updated_at") for image_doc in images}
+        try:
+            await asset_collection.bulk_write([
+                UpdateOne(
+                    {"_id": asset_id, "updated_at": versions[asset_id], "preview_data": {"$exists": False}},
+                    {"$set": preview}
+                )
+                for asset_id, preview in previews.items()
+            ], ordered=False)
+        except Exception as e:
+            logger.warning(f"Could not store backfilled previews: {e}")
+
 class AssetBatchResponse(BaseModel):
     assets: List[AssetResponse]
     batch_id: str
@@ -28,6 +142,25 @@ class AssetBatchResponse(BaseModel):
     current_page: int
     page_size: int
     cache_key: str
+    # _id of the last document on the page, pass as `after` to fetch the next page
+    next_cursor: Optional[str] = None
+
+
+async def count_assets(query_filter: dict) -> int:
+    """Count matching assets; an unfiltered count reads collection metadata instead of the index"""
+    if not query_filter:
+        return await asset_collection.estimated_document_count()
+    # type is the leading key of the (type, gen) index
+    return await asset_collection.count_documents(query_filter)
+
+
+def model_json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model straight to JSON bytes in pydantic-core.
+    Returning the model itself would make FastAPI re-validate it against
+    response_model and walk every base64 string in jsonable_encoder first.
+    """
+    return Response(content=model.model_dump_json(by_alias=True), media_type="application/json")
 
 
 @router.get("/batched", response_model=AssetBatchResponse)
@@ -36,12 +169,27 @@ async def get_assets_batched(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Number of assets per page"),
     image_quality: int = Query(20, ge=10, le=95, description="Image quality for JPEGs (10-95)"),
-    max_image_width: Optional[int] = Query(None, ge=60, description="Maximum width for resized images")
+    max_image_width: Optional[int] = Query(None, ge=60, description="Maximum width for resized images"),
+    include_images: bool = Query(True, description="Embed base64 images; set false for a metadata-only listing")
 ):
     """
     Get assets with improved caching and batching for better performance
     """
-    cache_key = generate_cache_key(type, page, page_size, image_quality, max_image_width)
+    return model_json_response(await load_asset_batch(
+        type, page, page_size, image_quality, max_image_width, include_images
+    ))
+
+
+async def load_asset_batch(
+    type: Optional[str],
+    page: int,
+    page_size: int,
+    image_quality: int,
+    max_image_width: Optional[int],
+    include_images: bool
+) -> AssetBatchResponse:
+    """Load one page of assets, from the batch cache when possible"""
+    cache_key = generate_cache_key(type, page, page_size, image_quality, max_image_width, include_images)
     
     # Try to get from cache first
     cached_data = await get_cached_batch(cache_key, cache_collection)
@@ -54,40 +202,26 @@ async def get_assets_batched(
 
     skip_amount = (page - 1) * page_size
     
-    # Use aggregation pipeline for better performance
-    pipeline = [
-        {"$match": query_filter},
-        {"$facet": {
-            "data": [
-                {"$skip": skip_amount},
-                {"$limit": page_size},
-                {"$project": {
-                    "_id": 1,
-                    "name": 1,
-                    "type": 1,
-                    "subcategory": 1,
-                    "gen": 1,
-                    "description": 1,
-                    "image_url": 1,
-                    "image_data": 1,
-                    "contentType": 1,
-                    "created_at": 1
-                }}
-            ],
-            "count": [
-                {"$count": "total"}
-            ]
-        }}
-    ]
-    
-    result = await asset_collection.aggregate(pipeline).to_list(1)
+    projection = listing_projection(include_images, image_quality, max_image_width)
+    # Fetch the page and count alongside it; unlike a $facet count, both
+    # can use the (type, _id) index
+    assets_data, total_assets_count = await asyncio.gather(
+        asset_collection.find(query_filter, projection)
+            # Newest first, in the same order the `after` cursor walks
+            .sort("_id", -1)
+            .skip(skip_amount)
+            .limit(page_size)
+            .to_list(page_size),
+        count_assets(query_filter)
+    )
+    total_pages = math.ceil(total_assets_count / page_size)
     
-    if not result or not result[0]["data"]:
+    if not assets_data:
         empty_response = {
             "assets": [],
-            "batch_id": f"batch_{page}_{cache_key[:8]}",
-            "total_assets": 0,
-            "total_pages": 0,
+            "batch_id": f"batch_{cache_key}",
+            "total_assets": total_assets_count,
+            "total_pages": total_pages,
             "current_page": page,
             "page_size": page_size,
             "cache_key": cache_key
@@ -95,43 +229,12 @@ async def get_assets_batched(
         await set_cached_batch(cache_key, empty_response)
         return AssetBatchResponse(**empty_response)
     
-    assets_data = result[0]["data"]
-    total_assets_count = result[0]["count"][0]["total"] if result[0]["count"] else 0
-    total_pages = math.ceil(total_assets_count / page_size)
-    
-    # Process images in parallel
-    async def process_asset_image(asset_doc_raw):
-        try:
-            asset_data_for_response = dict(asset_doc_raw)
-            
-            if asset_doc_raw.get("image_data") and isinstance(asset_doc_raw["image_data"], bytes):
-                # Process image in executor to avoid blocking
-                loop = asyncio.get_event_loop()
-                processed_image = await loop.run_in_executor(
-                    None, 
-                    process_image_sync, 
-                    asset_doc_raw["image_data"],
-                    asset_doc_raw.get("contentType", "image/png"),
-                    image_quality,
-                    max_image_width
-                )
-                
-                if processed_image:
-                    asset_data_for_response["image_data_base64"] = processed_image["base64"]
-                    asset_data_for_response["image_content_type"] = processed_image["content_type"]
-            
-            # Remove unnecessary fields
-            for field in ["description_vector", "image_embedding", "image_data"]:
-                asset_data_for_response.pop(field, None)
-            
-            return AssetResponse.model_validate(asset_data_for_response)
-        except Exception as e:
-            logging.error(f"Error processing asset {asset_doc_raw.get('_id')}: {e}")
-            return None
+    if "preview_data" in listing_image_fields(include_images, image_quality, max_image_width):
+        await load_missing_previews(assets_data)
     
     # Process all assets concurrently
     processed_assets = await asyncio.gather(
-        *[process_asset_image(asset) for asset in assets_data],
+        *[process_asset_image(asset, image_quality, max_image_width) for asset in assets_data],
         return_exceptions=True
     )
     
@@ -140,59 +243,81 @@ async def get_assets_batched(
     
     response_data = {
         "assets": valid_assets,
-        "batch_id": f"batch_{page}_{cache_key[:8]}",
+        "batch_id": f"batch_{cache_key}",
         "total_assets": total_assets_count,
         "total_pages": total_pages,
         "current_page": page,
         "page_size": page_size,
-        "cache_key": cache_key
+        "cache_key": cache_key,
+        # From the fetched documents, so an asset that failed to process
+        # still moves the cursor past it
+        "next_cursor": str(assets_data[-1]["_id"]) if page < total_pages else None
     }
     
-    # Cache the response
-    await set_cached_batch(cache_key, response_data)
+    # Cache plain dicts so callers can't mutate the cached assets
+    await set_cached_batch(cache_key, {
+        **response_data,
+        "assets": [asset.model_dump(by_alias=True) for asset in valid_assets]
+    })
     
     return AssetBatchResponse(**response_data)
 
-def process_image_sync(image_bytes: bytes, content_type: str, quality: int, max_width: Optional[int]) -> Optional[dict]:
-    """Synchronous image processing function for executor"""
+async def process_asset_image(asset_doc_raw: dict, image_quality: int, max_image_width: Optional[int]) -> Optional[AssetResponse]:
+    """
+    Build the response for one asset, encoding its image if it was fetched.
+    The document is fresh from Motor, so its image fields are popped in place
+    rather than copying the whole document.
+    """
     try:
-        img = Image.open(io.BytesIO(image_bytes))
-        
-        save_format = 'JPEG'
-        if content_type.lower() == "image/png":
-            save_format = 'PNG'
-        elif content_type.lower() == "image/webp":
-            save_format = 'WEBP'
+        preview_data = asset_doc_raw.pop("preview_data", None)
+        image_data = asset_doc_raw.pop("image_data", None)
         
-        # Resize if needed
-        if max_width and img.width > max_width:
-            aspect_ratio = img.height / img.width
-            new_height = int(max_width * aspect_ratio)
-            img = img.resize((max_width, new_height), Image.Resampling.LANCZOS)
-        
-        output_buffer = io.BytesIO()
-        if save_format == 'JPEG':
-            if img.mode in ('RGBA', 'LA', 'P'):
-                img = img.convert('RGB')
-            img.save(output_buffer, format=save_format, quality=quality, optimize=True)
-            final_content_type = "image/jpeg"
-        elif save_format == 'PNG':
-            img.save(output_buffer, format=save_format, optimize=True)
-            final_content_type = "image/png"
-        elif save_format == 'WEBP':
-            img.save(output_buffer, format=save_format, quality=quality)
-            final_content_type = "image/webp"
-        else:
-            img.save(output_buffer, format=img.format or 'PNG')
-            final_content_type = content_type
+        if preview_data:
+            # Encoded at save time with the settings this listing asked for
+            asset_doc_raw["image_data_base64"] = encode_base64(preview_data)
+            asset_doc_raw["image_content_type"] = asset_doc_raw["preview_content_type"]
+        elif image_data and isinstance(image_data, bytes):
+            content_type = asset_doc_raw.get("contentType") or sniff_image_type(image_data)
+            cache_key = (
+                asset_doc_raw["_id"], asset_doc_raw.get("updated_at"),
+                content_type, max_image_width, image_quality
+            )
+            processed_image = _thumbnail_cache.get(cache_key)
+            if processed_image is None:
+                # Encode on the image pool so a page of images uses every core
+                loop = asyncio.get_running_loop()
+                processed_image = await loop.run_in_executor(
+                    IMAGE_EXECUTOR, 
+                    process_image_sync, 
+                    image_data,
+                    content_type,
+                    image_quality,
+                    max_image_width
+                )
+                if processed_image:
+                    _thumbnail_cache[cache_key] = processed_image
+            
+            if processed_image:
+                asset_doc_raw["image_data_base64"] = processed_image["base64"]
+                asset_doc_raw["image_content_type"] = processed_image["content_type"]
         
-        compressed_image_bytes = output_buffer.getvalue()
+        return AssetResponse.from_mongo(asset_doc_raw)
+    except Exception as e:
+        logger.error(f"Error processing asset {asset_doc_raw.get('_id')}: {e}")
+        return None
+
+def process_image_sync(image_bytes: bytes, content_type: str, quality: int, max_width: Optional[int]) -> Optional[dict]:
+    """Synchronous image processing function for executor"""
+    try:
+        compressed_image_bytes, final_content_type = resize_and_encode(
+            image_bytes, format_for_content_type(content_type), quality, max_width
+        )
         return {
-            "base64": base64.b64encode(compressed_image_bytes).decode('utf-8'),
+            "base64": encode_base64(compressed_image_bytes),
             "content_type": final_content_type
         }
     except Exception as e:
-        logging.warning(f"Image processing failed: {e}")
+        logger.warning(f"Image processing failed: {e}")
         return None
 
 # Keep the original endpoint for backward compatibility
@@ -202,35 +327,161 @@ async def get_assets(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Number of assets per page"),
     image_quality: int = Query(20, ge=10, le=95, description="Image quality for JPEGs (10-95)"),
-    max_image_width: Optional[int] = Query(None, ge=60, description="Maximum width for resized images")
+    max_image_width: Optional[int] = Query(None, ge=60, description="Maximum width for resized images"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: bool = Query(False, description="Count matching assets on cursor requests"),
+    include_images: bool = Query(False, description="Embed base64 images; by default fetch them via /image/{asset_id}")
 ):
-    """Original endpoint - redirects to batched version"""
-    batched_response = await get_assets_batched(type, page, page_size, image_quality, max_image_width)
-    
-    # Remove image_data_base64 from the response
-    for asset in batched_response.assets:
-        if hasattr(asset, 'image_data_base64'):
-            del asset.image_data_base64
+    """Original endpoint - redirects to batched version, or pages by cursor when `after` is set"""
+    if after is not None:
+        if not ObjectId.is_valid(after):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        return model_json_response(await get_assets_after(
+            type, ObjectId(after), page_size, include_total, include_images, image_quality, max_image_width
+        ))
+
+    batched_response = await load_asset_batch(
+        type, page, page_size, image_quality, max_image_width, include_images
+    )
     
-    return PaginatedAssetResponse(
+    return model_json_response(PaginatedAssetResponse(
         assets=batched_response.assets,
         total_assets=batched_response.total_assets,
         total_pages=batched_response.total_pages,
         current_page=batched_response.current_page,
-        page_size=batched_response.page_size
+        page_size=batched_response.page_size,
+        include_images=include_images,
+        next_cursor=batched_response.next_cursor
+    ))
+
+async def fetch_assets_after(
+    query_filter: dict,
+    after: Optional[ObjectId],
+    page_size: int,
+    include_images: bool,
+    image_quality: int,
+    max_image_width: Optional[int]
+) -> List[dict]:
+    """Raw documents for one keyset page, newest first, previews filled in"""
+    if after is not None:
+        query_filter = {**query_filter, "_id": {"$lt": after}}
+    docs = await asset_collection.find(
+        query_filter, listing_projection(include_images, image_quality, max_image_width)
+    ).sort("_id", -1).limit(page_size).to_list(page_size)
+    if "preview_data" in listing_image_fields(include_images, image_quality, max_image_width):
+        await load_missing_previews(docs)
+    return docs
+
+async def get_assets_after(
+    type: Optional[str],
+    after: ObjectId,
+    page_size: int,
+    include_total: bool,
+    include_images: bool = False,
+    image_quality: int = 20,
+    max_image_width: Optional[int] = None
+) -> PaginatedAssetResponse:
+    """Keyset page of assets older than `after`, newest first.
+
+    Pages are ordered by _id like the page endpoint, so a cursor taken from
+    either continues the same sequence without skipping over every earlier
+    page. There is no page number on this path.
+    """
+    query_filter = {}
+    if type:
+        query_filter["type"] = type
+
+    page_docs = fetch_assets_after(
+        query_filter, after, page_size, include_images, image_quality, max_image_width
     )
+    if include_total:
+        # Count alongside the page fetch rather than after it
+        docs, total_assets = await asyncio.gather(page_docs, count_assets(query_filter))
+        total_pages = math.ceil(total_assets / page_size)
+    else:
+        docs = await page_docs
+        total_assets = total_pages = None
+    processed_assets = await asyncio.gather(
+        *[process_asset_image(doc, image_quality, max_image_width) for doc in docs]
+    )
+    assets = [asset for asset in processed_assets if asset is not None]
+
+    return PaginatedAssetResponse(
+        assets=assets,
+        total_assets=total_assets,
+        total_pages=total_pages,
+        page_size=page_size,
+        include_images=include_images,
+        next_cursor=str(docs[-1]["_id"]) if len(docs) == page_size else None
+    )
+
+@router.get("/stream")
+async def stream_assets(
+    type: Optional[str] = Query(None, description="Filter assets by type"),
+    page_size: int = Query(50, ge=1, le=100, description="Number of assets per page"),
+    image_quality: int = Query(20, ge=10, le=95, description="Image quality for JPEGs (10-95)"),
+    max_image_width: Optional[int] = Query(None, ge=60, description="Maximum width for resized images"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor")
+):
+    """
+    Stream a page of assets with their images as NDJSON. The first line holds
+    the page metadata, then assets follow in listing order. Images encode
+    concurrently and each asset is written as soon as it and those before it
+    are done.
+    """
+    query_filter = {}
+    if type:
+        query_filter["type"] = type
+    after_id = None
+    if after is not None:
+        if not ObjectId.is_valid(after):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        after_id = ObjectId(after)
+
+    docs = await fetch_assets_after(query_filter, after_id, page_size, True, image_quality, max_image_width)
+    metadata = {
+        "page_size": page_size,
+        "next_cursor": str(docs[-1]["_id"]) if len(docs) == page_size else None
+    }
+    tasks = [
+        asyncio.ensure_future(process_asset_image(doc, image_quality, max_image_width))
+        for doc in docs
+    ]
+    # The tasks hold the only references to the raw images from here on
+    del docs
+
+    async def generate():
+        try:
+            yield orjson.dumps(metadata) + b"\n"
+            for task in tasks:
+                asset = await task
+                if asset is not None:
+                    yield asset.model_dump_json(by_alias=True).encode() + b"\n"
+        finally:
+            # Client went away mid-page
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 @router.post("/cache/invalidate")
 async def invalidate_cache(type_filter: Optional[str] = None):
     """Invalidate cache for specific type or all cache"""
     try:
+        # Local entries are few and short-lived, clear them all
+        clear_local_cache()
+
         if cache_collection is None:
-            raise HTTPException(status_code=500, detail="Cache not configured")
+            return {
+                "status": "success",
+                "deleted_entries": 0,
+                "message": "In-process cache cleared"
+            }
         
         query = {}
         if type_filter:
             # Invalidate cache entries that match the type filter pattern
-            query = {"cache_key": {"$regex": f"^{type_filter}_"}}
+            query = {"cache_key": {"$regex": f"^{re.escape(type_filter)}\\|"}}
         
         result = await cache_collection.delete_many(query)
         
@@ -240,7 +491,7 @@ async def invalidate_cache(type_filter: Optional[str] = None):
             "message": f"Cache invalidated for {'all entries' if not type_filter else f'type: {type_filter}'}"
         }
     except Exception as e:
-        logging.error(f"Cache invalidation error: {e}")
+        logger.error(f"Cache invalidation error: {e}")
         raise HTTPException(status_code=500, detail=f"Cache invalidation failed: {e}")
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -248,15 +499,24 @@ async def delete_asset(id: str):
     """
     Delete an asset by ID
     """
+    if not ObjectId.is_valid(id):
+        raise HTTPException(status_code=400, detail="Invalid asset ID format")
     try:
         object_id = ObjectId(id)
         delete_result = await asset_collection.delete_one({"_id": object_id})
         if delete_result.deleted_count == 0:
             raise HTTPException(status_code=404, detail=f"Asset with ID {id} not found")
+        clear_local_cache()
+        evict_thumbnails(object_id)
         return None 
+    except HTTPException:
+        raise
+    except ConnectionFailure:
+        logger.exception(f"Database unavailable while deleting asset {id}")
+        raise HTTPException(status_code=503, detail="Database unavailable")
     except Exception as e:
-        logging.error(f"Error deleting asset with ID {id}: {str(e)}")
-        raise HTTPException(status_code=400, detail=f"Invalid ID format or deletion error: {str(e)}")
+        logger.error(f"Error deleting asset with ID {id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error deleting asset: {str(e)}")
 
 @router.post("/", response_model=AssetResponse, status_code=status.HTTP_201_CREATED)
 async def create_asset(asset: AssetCreate = Body(...)):
@@ -264,20 +524,16 @@ async def create_asset(asset: AssetCreate = Body(...)):
     Create a new asset
     """
     try:
-        description_vector = None
-        asset_dict = asset.model_dump()
-        
-        if "description_vector" in asset_dict:
-            description_vector = asset_dict.pop("description_vector")
-        
-        clean_asset = AssetCreate(**asset_dict)
-        result = await save_asset_with_vector(clean_asset, description_vector)
+        # save_asset_with_vector dumps the asset without its vector and takes
+        # the vector separately, so the validated model can be passed as is
+        result = await save_asset_with_vector(asset, asset.description_vector)
         
         if result.get("status") == "saved":
+            clear_local_cache()
             if "description_vector" in result:
                 del result["description_vector"]
                 
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_201_CREATED,
                 content=result
             )
@@ -287,7 +543,7 @@ async def create_asset(asset: AssetCreate = Body(...)):
             raise HTTPException(status_code=500, detail="Unexpected response from save operation")
             
     except Exception as e:
-        logging.error(f"Error creating asset: {str(e)}")
+        logger.error(f"Error creating asset: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error creating asset: {str(e)}")
 
 @router.post("/validate", status_code=status.HTTP_200_OK)
@@ -310,37 +566,102 @@ async def validate_asset_vector(
         if "description_vector" in result:
             del result["description_vector"]
             
-        return JSONResponse(status_code=status.HTTP_200_OK, content=result)
+        return ORJSONResponse(status_code=status.HTTP_200_OK, content=result)
     except Exception as e:
-        logging.error(f"Error validating asset: {e}")
+        logger.error(f"Error validating asset: {e}")
         raise HTTPException(status_code=500, detail=f"Error validating asset: {str(e)}")
 
 
+def asset_image_etag(asset_id: str, asset: dict, variant: str = "") -> str:
+    """Images only change through update_asset, which bumps updated_at."""
+    updated_at = asset.get("updated_at")
+    version = int(updated_at.timestamp() * 1000) if updated_at else 0
+    return f'"{asset_id}-{version}{variant}"'
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison against an If-None-Match list, as proxies that
+    compress responses hand back W/-prefixed tags"""
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
 @router.get("/image/{asset_id}")
-async def get_asset_image(asset_id: str):
+async def get_asset_image(
+    asset_id: str,
+    request: Request,
+    w: Optional[int] = Query(None, ge=16, le=4096, description="Downscale to at most this width"),
+    q: Optional[int] = Query(None, ge=10, le=95, description="Re-encode at this quality (JPEG/WebP)")
+):
+    """
+    Serve an asset's stored image, or a downscaled/re-encoded thumbnail of it
+    when w or q is given. Listings link here instead of inlining base64.
+    """
     try:
         if not ObjectId.is_valid(asset_id):
             raise HTTPException(status_code=400, detail="Invalid asset ID format")
+        object_id = ObjectId(asset_id)
+        resized = w is not None or q is not None
+        quality = q if q is not None else THUMBNAIL_DEFAULT_QUALITY
+        variant = f"-w{w or 0}-q{quality}" if resized else ""
+        use_preview = resized and (w, quality) == (PREVIEW_MAX_WIDTH, PREVIEW_QUALITY)
+
+        # Revalidation only needs the version, not the image bytes
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            asset = await asset_collection.find_one({"_id": object_id}, {"updated_at": 1})
+            if asset:
+                etag = asset_image_etag(asset_id, asset, variant)
+                if etag_matches(if_none_match, etag):
+                    return Response(
+                        status_code=status.HTTP_304_NOT_MODIFIED,
+                        headers={"ETag": etag, "Cache-Control": IMAGE_CACHE_CONTROL}
+                    )
             
-        asset = await asset_collection.find_one({"_id": ObjectId(asset_id)})
-        
-        if not asset:
-            raise HTTPException(status_code=404, detail="Asset not found")
-            
-        if "image_data" not in asset or not asset["image_data"]:
-            raise HTTPException(status_code=404, detail="Asset has no image data")
-            
-        content_type = "image/jpeg"
+        asset = None
+        if use_preview:
+            # The stored preview is all this variant needs; the original is
+            # only fetched when there is no preview to serve
+            asset = await asset_collection.find_one(
+                {"_id": object_id}, {"preview_data": 1, "preview_content_type": 1, "updated_at": 1}
+            )
+            if not asset:
+                raise HTTPException(status_code=404, detail="Asset not found")
+
+        if asset and asset.get("preview_data"):
+            content, content_type = asset["preview_data"], asset["preview_content_type"]
+        else:
+            asset = await asset_collection.find_one(
+                {"_id": object_id}, {"image_data": 1, "contentType": 1, "updated_at": 1}
+            )
+
+            if not asset:
+                raise HTTPException(status_code=404, detail="Asset not found")
+
+            if "image_data" not in asset or not asset["image_data"]:
+                raise HTTPException(status_code=404, detail="Asset has no image data")
+
+            # Stored at ingest for new assets; sniff older ones
+            content = asset["image_data"]
+            content_type = asset.get("contentType") or sniff_image_type(content)
+            if resized:
+                loop = asyncio.get_running_loop()
+                content, content_type = await loop.run_in_executor(
+                    IMAGE_EXECUTOR, resize_and_encode,
+                    content, format_for_content_type(content_type), quality, w
+                )
         
         return Response(
-            content=asset["image_data"], 
-            media_type=content_type
+            content=content, 
+            media_type=content_type,
+            headers={
+                "ETag": asset_image_etag(asset_id, asset, variant),
+                "Cache-Control": IMAGE_CACHE_CONTROL
+            }
         )
             
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error retrieving asset image: {e}", exc_info=True)
+        logger.error(f"Error retrieving asset image: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
     
 
@@ -349,6 +670,8 @@ async def update_asset(id: str, updates: dict = Body(...)):
     """
     Update an asset by ID with partial data
     """
+    if not ObjectId.is_valid(id):
+        raise HTTPException(status_code=400, detail="Invalid asset ID format")
     try:
         object_id = ObjectId(id)
         
@@ -360,31 +683,38 @@ async def update_asset(id: str, updates: dict = Body(...)):
             raise HTTPException(status_code=400, detail="No valid fields to update")
         
         # Add updated timestamp
-        clean_updates['updated_at'] = datetime.utcnow()
+        clean_updates['updated_at'] = datetime.now(timezone.utc)
         
-        # Update the asset
-        update_result = await asset_collection.update_one(
+        update = {"$set": clean_updates}
+        if "image_data" in clean_updates:
+            # The stored preview and image metadata describe the old image;
+            # readers sniff the type when contentType is missing
+            update["$unset"] = {
+                field: "" for field in IMAGE_DERIVED_FIELDS if field not in clean_updates
+            }
+
+        # Update the asset and get it back in one round trip, leaving the
+        # image and vectors on the server
+        updated_asset = await asset_collection.find_one_and_update(
             {"_id": object_id},
-            {"$set": clean_updates}
+            update,
+            projection=ASSET_RESPONSE_PROJECTION,
+            return_document=ReturnDocument.AFTER
         )
         
-        if update_result.matched_count == 0:
-            raise HTTPException(status_code=404, detail=f"Asset with ID {id} not found")
-        
-        # Fetch and return the updated asset
-        updated_asset = await asset_collection.find_one({"_id": object_id})
         if not updated_asset:
-            raise HTTPException(status_code=404, detail="Asset not found after update")
-        
-        # Remove sensitive fields before returning
-        for field in ["description_vector", "image_embedding", "image_data"]:
-            updated_asset.pop(field, None)
+            raise HTTPException(status_code=404, detail=f"Asset with ID {id} not found")
+        clear_local_cache()
+        evict_thumbnails(object_id)
         
-        return AssetResponse.model_validate(updated_asset)
+        return AssetResponse.from_mongo(updated_asset)
         
     except HTTPException:
         raise
+    except ConnectionFailure:
+        logger.exception(f"Database unavailable while updating asset {id}")
+        raise HTTPException(status_code=503, detail="Database unavailable")
     except Exception as e:
-        logging.error(f"Error updating asset with ID {id}: {str(e)}")
+        logger.error(f"Error updating asset with ID {id}: {str(e)}")
         raise HTTPException(status_code=400, detail=f"Invalid ID format or update error: {str(e)}")
 
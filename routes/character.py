@@ -1,20 +1,30 @@
-from fastapi import APIRouter, Body, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Body, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.encoders import jsonable_encoder
 from typing import List
+import orjson
 
 from models.character import CharacterCreate, CharacterResponse, CharacterDB
 from database import character_collection
 
 router = APIRouter()
 
+CHARACTER_EMBEDDING_FIELDS = {"description_vector", "avatar_embedding", "body_embedding", "transparent_embedding"}
+
+# Embeddings are only needed for search, keep them out of list payloads
+CHARACTER_LIST_PROJECTION = {field: 0 for field in CHARACTER_EMBEDDING_FIELDS}
+
 @router.get("/", response_model=List[CharacterResponse])
 async def get_characters():
     """
     Get all characters from the database
     """
-    characters = await character_collection.find().to_list(1000)
-    return characters
+    characters = await character_collection.find({}, CHARACTER_LIST_PROJECTION).to_list(1000)
+    # Trusted documents straight from Mongo: dump them in one orjson pass
+    # instead of validating and re-serializing every row through pydantic
+    for character in characters:
+        character["id"] = str(character.pop("_id"))
+    return Response(content=orjson.dumps(characters, default=str), media_type="application/json")
 
 @router.get("/{id}", response_model=CharacterResponse)
 async def get_character(id: str):
@@ -31,8 +41,13 @@ async def create_character(character: CharacterCreate = Body(...)):
     """
     Create a new character
     """
-    character = jsonable_encoder(CharacterDB(**character.dict()))
+    character_db = CharacterDB(**character.dict())
+    character = jsonable_encoder(character_db, exclude=CHARACTER_EMBEDDING_FIELDS)
+    # Keep embeddings as packed float32 vectors rather than JSON lists
+    character.update(character_db.model_dump(include=CHARACTER_EMBEDDING_FIELDS, exclude_none=True))
     new_character = await character_collection.insert_one(character)
-    created_character = await character_collection.find_one({"_id": new_character.inserted_id})
+    created_character = await character_collection.find_one(
+        {"_id": new_character.inserted_id}, CHARACTER_LIST_PROJECTION
+    )
     
-    return JSONResponse(status_code=status.HTTP_201_CREATED, content=created_character)
\ No newline at end of file
+    return ORJSONResponse(status_code=status.HTTP_201_CREATED, content=created_character)
\ No newline at end of file
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Query, HTTPException, Path
+from fastapi import APIRouter, Query, HTTPException, Path, Response
 from typing import List, Optional
 from bson import ObjectId
-from models.generation import GenerationResponse
+from models.generation import GenerationResponse, GENERATION_LIST_ADAPTER
 from database import generation_collection
 from services.leo import delete_generation_api
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -37,15 +38,6 @@ async def get_generations(
         filter_query["character_id"] = {
             "$in": [character_obj_id, character_id]
         }
-        
-        # Debug: Log the query being executed
-        logger.info(f"Querying with character_id: {character_id} (ObjectId: {character_obj_id})")
-        
-        # Debug: Check what's actually in the database
-        sample_docs = await generation_collection.find({}).limit(5).to_list(5)
-        logger.info(f"Sample documents in collection:")
-        for doc in sample_docs:
-            logger.info(f"  - character_id: {doc.get('character_id')} (type: {type(doc.get('character_id'))})")
 
     projection = {"description_vector": 0}
 
@@ -60,7 +52,10 @@ async def get_generations(
     # Debug: Log the results
     logger.info(f"Found {len(generations)} generations matching the query")
 
-    return generations
+    body = GENERATION_LIST_ADAPTER.dump_json(
+        [GenerationResponse.from_mongo(doc) for doc in generations], by_alias=True
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.delete("/{generation_id}", status_code=204)
@@ -85,7 +80,7 @@ async def delete_generation(
 
     try:
         if item: 
-            delete_generation_api(item.get("leo_id", generation_id))
+            await asyncio.to_thread(delete_generation_api, item.get("leo_id", generation_id))
             logger.info(f"Deleted generation with ID: {generation_id}")
         else:
             logger.warning(f"Generation with ID {generation_id} not found in collection")
@@ -1,15 +1,12 @@
 from fastapi import APIRouter, Query, HTTPException
 from fastapi.responses import StreamingResponse
-from typing import List, Dict, Optional
+from typing import Optional
 import zipfile
 import io
 from bson import ObjectId
-from PIL import Image
-import json
-import base64
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from database import asset_collection
+from services.image_processing import resize_and_encode
 import logging
 
 logger = logging.getLogger(__name__)
@@ -123,27 +120,9 @@ async def get_single_image_data(asset_id: str, params: dict, format: str) -> tup
         
         # Process image with params
         if params:
-            img = Image.open(io.BytesIO(image_data))
-            
-            # Resize if width specified
-            if "width" in params:
-                width = params["width"]
-                ratio = width / img.width
-                height = int(img.height * ratio)
-                img = img.resize((width, height), Image.Resampling.LANCZOS)
-            
-            # Convert format and quality
-            output_buffer = io.BytesIO()
-            if format.lower() == "jpeg":
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    img = img.convert('RGB')
-                img.save(output_buffer, format='JPEG', quality=params.get("quality", 85), optimize=True)
-            elif format.lower() == "png":
-                img.save(output_buffer, format='PNG', optimize=True)
-            elif format.lower() == "webp":
-                img.save(output_buffer, format='WEBP', quality=params.get("quality", 85))
-            
-            image_data = output_buffer.getvalue()
+            image_data, _ = resize_and_encode(
+                image_data, format.upper(), params.get("quality", 85), params.get("width")
+            )
         
         return image_data, filename
         
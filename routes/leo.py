@@ -23,7 +23,7 @@ class DeleteGenerationsRequest(BaseModel):
 async def delete_generations(request: DeleteGenerationsRequest):
     try:  
         for generation_id in request.generation_ids:
-            delete_generation_api(generation_id)
+            await asyncio.to_thread(delete_generation_api, generation_id)
             logger.info(f"Deleted generation with ID: {generation_id}")
         return {"status": "success", "message": "Generations deleted successfully."}
     except Exception as e:
@@ -66,7 +66,8 @@ async def generate_and_save_asset_image(request: AssetImageGenerationRequest):
         }
         
         # Use the preview function that returns Leonardo URL immediately
-        result = create_asset_img_with_preview(
+        result = await asyncio.to_thread(
+            create_asset_img_with_preview,
             gen=request.gen,
             asset_data=asset_data
         )
@@ -121,19 +122,21 @@ async def generate_and_save_gen_image(request: GenerationRequest):
         if request.generation_id:
             try:
                 logger.info(f"Deleting previous generation with ID: {request.generation_id}")
-                delete_generation_api(request.generation_id)
+                await asyncio.to_thread(delete_generation_api, request.generation_id)
             except Exception as e:
                 logger.warning(f"Failed to delete previous generation {request.generation_id}: {e}")
 
         # Generate image
-        create_response = create_asset_img(gen=request.gen, element=request.element, weight=request.weight, preset=request.preset)
+        create_response = await asyncio.to_thread(
+            create_asset_img, gen=request.gen, element=request.element, weight=request.weight, preset=request.preset
+        )
         
         generation_id = create_response["sdGenerationJob"]["generationId"]
         logger.info(f"Created new generation with ID: {generation_id}")
         images = None
         for attempt in range(12):  # 12 attempts x 5s = 60s max
             try:
-                images = get_generation(generation_id)
+                images = await asyncio.to_thread(get_generation, generation_id)
                 if images:  
                     logger.info(f"Images found after {attempt + 1} attempts.")
                     break
@@ -158,7 +161,6 @@ async def generate_and_save_gen_image(request: GenerationRequest):
             used_assets_transformed = [
                 UsedAssets(
                     id=asset.id,
-                    _id=asset.id,  # Set both for compatibility
                     name=asset.name,
                     type=asset.type,
                     subcategory=asset.subcategory,
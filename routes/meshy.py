@@ -1,14 +1,16 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from bson import ObjectId
-import os
+from config import config
 from services.meshy import generate_3d_asset_from_image
 from services.background_polling import meshy_polling_service
 from database import generation_collection
+from models.generation import TextureInfo
 from typing import Optional, Dict, List, Any
 import logging
 import requests
+import asyncio
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +29,6 @@ class Image3DGenerationResponse(BaseModel):
     status: str
     generation_id: str
 
-class TextureInfo(BaseModel):
-    base_color: Optional[str] = None
-    metallic: Optional[str] = None
-    normal: Optional[str] = None
-    roughness: Optional[str] = None
-
 class ModelStatusResponse(BaseModel):
     id: str
     model_urls: Optional[Dict[str, str]] = None
@@ -54,13 +50,13 @@ async def create_3d_model(request: Image3DGenerationRequest):
         generation = await generation_collection.find_one({"_id": ObjectId(request.generation_id)})
         if not generation:
             raise HTTPException(status_code=404, detail="Generation not found")
-        from config import config
         api_key = config.meshy_api_key
         if not api_key:
             raise HTTPException(status_code=500, detail="MESHY_API_KEY not found in environment variables")
         
         # Call the Meshy service
-        response = generate_3d_asset_from_image(
+        response = await asyncio.to_thread(
+            generate_3d_asset_from_image,
             image_input=request.image_url,
             api_key=api_key,
             use_base64=False 
@@ -176,7 +172,7 @@ async def proxy_model_file(task_id: str, file_type: str):
             raise HTTPException(status_code=404, detail=f"File type {file_type} not available")
         
         # Fetch the file from Meshy
-        response = requests.get(model_url, stream=True)
+        response = await asyncio.to_thread(requests.get, model_url, timeout=60)
         response.raise_for_status()
         
         # Determine content type
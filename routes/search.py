@@ -1,6 +1,6 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from typing import List
-from models.generation import GenerationSearchQuery, GenerationSearchResult
+from models.generation import GenerationSearchQuery, GenerationSearchResult, SEARCH_RESULT_LIST_ADAPTER
 from services.atlas_gen_search import atlas_search_service
 import logging
 
@@ -21,7 +21,8 @@ async def search_generations(search_query: GenerationSearchQuery):
     """
     try:
         results = await atlas_search_service.semantic_search(search_query)
-        return results
+        body = SEARCH_RESULT_LIST_ADAPTER.dump_json(results, by_alias=True)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Search failed: {e}")
         raise HTTPException(status_code=500, detail="Search operation failed")
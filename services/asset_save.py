@@ -1,15 +1,24 @@
+import asyncio
 import logging
 import numpy as np
 
 from typing import List, Dict, Any, Optional
 from models.asset import AssetCreate, AssetDB
+from models._types import unpack_vector
 from database import asset_collection
-from utils.db_helpers import serialize_for_json
+from utils.db_helpers import serialize_document
+from utils.image_types import image_metadata
+from services.image_processing import IMAGE_EXECUTOR, build_preview
 from services.atlas_asset_search import asset_vector_search_service
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 from utils.openai_embeddings import get_embedding
 
+SIMILARITY_PROJECTION = {
+    "name": 1, "type": 1, "description": 1, "image_url": 1, "description_vector": 1
+}
+SIMILARITY_BATCH_SIZE = 100
+
 def calculate_similarity(vec1: List[float], vec2: List[float]) -> float:
     """
     Calculate cosine similarity between two vectors
@@ -17,8 +26,8 @@ def calculate_similarity(vec1: List[float], vec2: List[float]) -> float:
     if not vec1 or not vec2:
         return 0.0
         
-    vec1_array = np.array(vec1)
-    vec2_array = np.array(vec2)
+    vec1_array = unpack_vector(vec1)
+    vec2_array = unpack_vector(vec2)
     
     dot_product = np.dot(vec1_array, vec2_array)
     norm_vec1 = np.linalg.norm(vec1_array)
@@ -35,14 +44,15 @@ async def find_similar_assets(asset: AssetCreate, embedding: List[float], thresh
     Find assets similar to the provided one based on embedding similarity
     Returns list of similar assets with similarity scores
     """
-    all_assets = await asset_collection.find({"description_vector": {"$exists": True}}).to_list(1000)
-    
-    if not all_assets:
-        return []
+    # Stream only the fields we compare and return; image_data stays in Mongo
+    cursor = asset_collection.find(
+        {"description_vector": {"$exists": True}},
+        SIMILARITY_PROJECTION
+    ).batch_size(SIMILARITY_BATCH_SIZE)
     
     similar_assets = []
     
-    for db_asset in all_assets:
+    async for db_asset in cursor:
         if not db_asset.get("description_vector"):
             continue
             
@@ -103,9 +113,16 @@ async def save_asset_with_vector(asset: AssetCreate, embedding: Optional[List[fl
         )
         
         asset_to_insert = asset_db.dict(by_alias=True)
+        if asset_to_insert.get("image_data"):
+            asset_to_insert.update(image_metadata(
+                asset_to_insert["image_data"], asset_to_insert.get("contentType")
+            ))
+            asset_to_insert.update(await asyncio.get_running_loop().run_in_executor(
+                IMAGE_EXECUTOR, build_preview, asset_to_insert["image_data"], asset_to_insert.get("contentType", "")
+            ))
         
         result = await asset_collection.insert_one(asset_to_insert)
-        created_asset = await asset_collection.find_one({"_id": result.inserted_id})
+        created_asset = await asset_collection.find_one({"_id": result.inserted_id}, {"preview_data": 0})
         
         if not created_asset:
             return {
@@ -115,9 +132,7 @@ async def save_asset_with_vector(asset: AssetCreate, embedding: Optional[List[fl
                 "description_vector": embedding
             }
         
-        serialized_asset = serialize_for_json(dict(created_asset))
-        if "_id" in serialized_asset and "id" not in serialized_asset:
-            serialized_asset["id"] = serialized_asset["_id"]
+        serialized_asset = serialize_document(created_asset)
         
         return {
             **serialized_asset,
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from models.asset import AssetCreate, AssetResponse
+from models._types import pack_vector
 from utils.openai_embeddings import get_embedding
 from database import asset_collection
 import logging
@@ -95,11 +96,10 @@ class AssetVectorSearchService:
                         "gen": 1,
                         "description": 1,
                         "image_url": 1,
-                        "image_data": 1,
                         "metadata": 1,
                         "created_at": 1,
                         "similarity_mongo": 1
-                        # Exclude description_vector and image_embedding from results
+                        # Exclude description_vector, image_embedding and image_data from results
                     }
                 }
             ]
@@ -201,8 +201,12 @@ class AssetVectorSearchService:
         """Add embeddings to all assets that don't have them."""
         count = 0
         try:
-            # Find assets without embeddings
-            cursor = self.collection.find({"description_vector": {"$exists": False}})
+            # Find assets without embeddings; only the text fields are embedded,
+            # so leave the image payloads on the server
+            cursor = self.collection.find(
+                {"description_vector": {"$exists": False}},
+                {"name": 1, "description": 1},
+            ).batch_size(100)
             
             async for doc in cursor:
                 try:
@@ -215,7 +219,7 @@ class AssetVectorSearchService:
                         {"_id": doc["_id"]},
                         {
                             "$set": {
-                                "description_vector": embedding
+                                "description_vector": pack_vector(embedding)
                             }
                         }
                     )
@@ -1,5 +1,6 @@
 from typing import List
 from models.generation import GenerationSearchQuery, GenerationSearchResult, Generation
+from models._types import pack_vector
 from services.embedding import embedding_service
 from database import generation_collection
 import logging
@@ -64,7 +65,7 @@ class AtlasSearchService:
                         "filter": {
                             # Only search generations that have completed processing
                             "$or": [
-                                {"meshy.status": {"$eq": "succeeded"}},
+                                {"meshy.status": {"$eq": "completed"}},
                                 {"meshy": {"$exists": False}},  # Include non-3D generations
                                 {"has_3d_model": {"$eq": True}}
                             ]
@@ -93,19 +94,13 @@ class AtlasSearchService:
             cursor = self.collection.aggregate(pipeline)
             results = []
             
+            # Documents come straight from our own collection, so build the
+            # models without re-running validation on every field
             async for doc in cursor:
-                try:
-                    # Convert MongoDB document to Generation model
-                    generation = Generation(**doc)
-                    score = doc.get("score", 0.0)
-                    
-                    results.append(GenerationSearchResult(
-                        generation=generation,
-                        score=score
-                    ))
-                except Exception as e:
-                    logger.warning(f"Failed to convert document to Generation model: {e}")
-                    continue
+                results.append(GenerationSearchResult.model_construct(
+                    generation=Generation.from_mongo(doc),
+                    score=doc.get("score", 0.0)
+                ))
             
             logger.info(f"Semantic search returned {len(results)} results for query: '{search_query.query}'")
             return results
@@ -136,7 +131,7 @@ class AtlasSearchService:
                 {"_id": generation_id},
                 {
                     "$set": {
-                        "embedding": embedding,
+                        "embedding": pack_vector(embedding),
                         "searchable_text": searchable_text
                     }
                 }
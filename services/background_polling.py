@@ -1,8 +1,8 @@
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
-import os
+from config import config
 from database import generation_collection
 from services.meshy import get_image_to_3d_task_status
 from bson import ObjectId
@@ -93,14 +93,13 @@ class MeshyPollingService:
             return
             
         try:
-            from config import config
             api_key = config.meshy_api_key
             if not api_key:
                 logger.error("MESHY_API_KEY not found in environment variables")
                 return
                 
             # Poll Meshy API
-            response = get_image_to_3d_task_status(task_id, api_key)
+            response = await asyncio.to_thread(get_image_to_3d_task_status, task_id, api_key)
             
             # Map status
             status_mapping = {
@@ -114,7 +113,7 @@ class MeshyPollingService:
             
             # Update polling info
             update_data = {
-                "meshy.last_polled": datetime.now(),
+                "meshy.last_polled": datetime.now(timezone.utc),
                 "meshy.polling_attempts": polling_attempts + 1,
                 "meshy.progress": response.get("progress", 0),
                 "meshy.status": mapped_status
@@ -162,7 +161,7 @@ class MeshyPollingService:
             await generation_collection.update_one(
                 {"_id": generation["_id"]},
                 {"$set": {
-                    "meshy.last_polled": datetime.now(),
+                    "meshy.last_polled": datetime.now(timezone.utc),
                     "meshy.polling_attempts": polling_attempts + 1
                 }}
             )
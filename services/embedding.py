@@ -1,16 +1,10 @@
 import logging
 import os
 from typing import List, Optional
-from dotenv import load_dotenv
+from config import config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load environment variables early, but handle failures gracefully
-try:
-    load_dotenv()
-except Exception as e:
-    logger.warning(f"Could not load .env file: {e}")
-
 class EmbeddingService:
     def __init__(self):
         """Initialize the embedding service with OpenAI."""
@@ -35,16 +29,10 @@ class EmbeddingService:
             logger.info("✅ Found OPENAI_API_KEY via os.getenv")
             return api_key
         
-        # Method 3: Try config (delayed import to avoid circular dependencies)
-        try:
-            from config import config
-            if hasattr(config, 'openai_api_key') and config.openai_api_key:
-                logger.info("✅ Found OPENAI_API_KEY in config")
-                return config.openai_api_key
-        except ImportError as e:
-            logger.warning(f"Could not import config: {e}")
-        except Exception as e:
-            logger.warning(f"Error accessing config.openai_api_key: {e}")
+        # Method 3: Try config (.env values loaded once at config import)
+        if config.openai_api_key:
+            logger.info("✅ Found OPENAI_API_KEY in config")
+            return config.openai_api_key
         
         # Method 4: Google Secret Manager (only if explicitly requested)
         if os.getenv("USE_SECRET_MANAGER", "false").lower() == "true":
@@ -1,10 +1,12 @@
 import logging 
 from typing import List, Dict, Any, Optional
-from services.image_save import download_image, get_embedding, serialize_for_json
+from services.image_save import download_image, get_embedding
+from utils.db_helpers import serialize_for_json, serialize_document
 from models.generation import GenerationBase, UsedAssets, GenerationCreate, Generation
 from bson import ObjectId
+from models._types import pack_vector
 from database import generation_collection
-from datetime import datetime
+from datetime import datetime, timezone
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,12 +17,8 @@ def get_all_generations() -> List[Dict[str, Any]]:
     """
     try:
         logger.info("Fetching all generations from the database.")
-        generations = list(generation_collection.find({}))
+        generations = list(generation_collection.find({}, {"description_vector": 0}))
         logger.info(f"Retrieved {len(generations)} generations.")
-        # Remove description_embedding from the serialized output
-        for gen in generations:
-            if "description_vector" in gen:
-                del gen["description_vector"]
         return [serialize_for_json(gen) for gen in generations]
     except Exception as e:
         logger.error(f"Error fetching generations: {e}", exc_info=True)
@@ -67,11 +65,8 @@ async def save_generation(
         # Process used assets if provided
         processed_used_assets = None
         if used_assets:
-            processed_used_assets = []
-            for asset in used_assets:
-                # Convert UsedAssets model to dict for MongoDB
-                asset_dict = asset.model_dump() if hasattr(asset, 'model_dump') else asset.dict()
-                processed_used_assets.append(asset_dict)
+            # UsedAssets are plain dicts already, copy them for MongoDB
+            processed_used_assets = [dict(asset) for asset in used_assets]
             logger.info(f"Processed {len(processed_used_assets)} used assets for storage")
         
         # Create generation instance with current timestamp
@@ -82,7 +77,7 @@ async def save_generation(
             description=description,
             description_vector=description_embedding,
             used_assets=processed_used_assets,
-            created_at=datetime.now()  # Explicitly set created_at
+            created_at=datetime.now(timezone.utc)  # Explicitly set created_at
         )
         
         # Convert to dict for MongoDB insertion, but manually handle character_id as ObjectId
@@ -107,10 +102,7 @@ async def save_generation(
                 "message": "Generation saved but not retrieved"
             }
             
-        serialized_generation = serialize_for_json(dict(created_generation))
-        
-        if "_id" in serialized_generation and "id" not in serialized_generation:
-            serialized_generation["id"] = serialized_generation["_id"]
+        serialized_generation = serialize_document(created_generation)
         
         logger.info(f"Generation saved successfully with ID: {serialized_generation.get('id')}")
 
@@ -138,10 +130,10 @@ class GenerationService:
             generation_dict = generation_data.dict()
             generation_dict.update({
                 "id": str(ObjectId()),
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow(),
+                "created_at": datetime.now(timezone.utc),
+                "updated_at": datetime.now(timezone.utc),
                 "status": "pending",
-                "embedding": embedding,
+                "embedding": pack_vector(embedding),
                 "searchable_text": searchable_text
             })
             
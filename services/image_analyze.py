@@ -1,10 +1,11 @@
 from google.genai import types
 from openai import OpenAI
-import base64
 import json
 from google import genai
 import logging
 from utils.json_extractor import extract_json_from_text
+from utils.image_types import sniff_image_type
+from services.image_processing import encode_base64
 from config import config
 
 logger = logging.getLogger(__name__)
@@ -14,16 +15,13 @@ google_api_key = config.google_api_key
 groq_api_key = config.groq_api_key
 
 
-def analyze_image(image_path: str, model: str, api_key=None) -> list:
-    with open(image_path, "rb") as image_file:
-        image_data = image_file.read()
-
-    base64_image = base64.b64encode(image_data).decode("utf-8")
+def analyze_image(image_data: bytes, model: str, api_key=None) -> list:
+    base64_image = encode_base64(image_data)
 
     image_dict = {
         "type": "image_url",
         "image_url": {
-            "url": f"data:image/jpeg;base64,{base64_image}"
+            "url": f"data:{sniff_image_type(image_data)};base64,{base64_image}"
         }
     }
 
@@ -103,19 +101,18 @@ def analyze_image(image_path: str, model: str, api_key=None) -> list:
         return []
 
 
-def analyze_with_gemini(image_path: str, api_key=None) -> list:
+def analyze_with_gemini(image_data: bytes, api_key=None) -> list:
     client = genai.Client(api_key=google_api_key)
-    files = [
-        client.files.upload(file=image_path),
-    ]
     model = "gemini-1.5-flash"
+    # Send the image inline rather than uploading it through the Files API
+    # first, which cost an extra round trip per analysis
     contents = [
         types.Content(
             role="user",
             parts=[
-                types.Part.from_uri(
-                    file_uri=files[0].uri,
-                    mime_type=files[0].mime_type,
+                types.Part.from_bytes(
+                    data=image_data,
+                    mime_type=sniff_image_type(image_data),
                 ),
                 types.Part.from_text(text="""Analyze following file"""),
             ],
@@ -148,8 +145,7 @@ def analyze_with_gemini(image_path: str, api_key=None) -> list:
         return []
     except Exception as e:
         logger.error("Error parsing Gemini response: %s", e)
-        print("Error:", e)
-        print("Response text:", response.text)
+        logger.debug("Gemini response text: %s", response.text)
         
         try:
             if hasattr(response, 'text'):
@@ -1,14 +1,16 @@
 import logging
 from openai import OpenAI
-import os
+import asyncio
 import requests
 from typing import List, Dict, Any, Optional, Tuple
 from models.asset import AssetCreate, AssetDB
 from database import asset_collection
-from utils.db_helpers import serialize_for_json
-import base64
+from utils.db_helpers import serialize_document
 from services.asset_save import get_embedding
 from config import config
+from utils.cached_batch import clear_local_cache
+from utils.image_types import image_metadata
+from services.image_processing import IMAGE_EXECUTOR, build_preview, encode_base64
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,7 +25,7 @@ async def get_image_embedding(image_data: bytes, api_key: Optional[str] = None)
     try:
         client = OpenAI(api_key=api_key or OPENAI_API_KEY)
         
-        base64_image = base64.b64encode(image_data).decode('utf-8')
+        base64_image = encode_base64(image_data)
         response = client.embeddings.create(
             model="text-embedding-ada-002",
             input=[
@@ -48,7 +50,7 @@ async def download_image(url: str) -> Tuple[bytes, Optional[str]]:
     Download an image from a URL and return the binary data
     """
     try:
-        response = requests.get(url, timeout=30)
+        response = await asyncio.to_thread(requests.get, url, timeout=30)
         response.raise_for_status()
 
         content_type = response.headers.get('Content-Type', '')
@@ -106,13 +108,29 @@ async def save_asset_with_image(
         
         # Convert to dict for MongoDB insertion
         asset_to_insert = asset_db.dict(by_alias=True)
+        if image_data:
+            # Record type, size and dimensions once so readers don't have to
+            # load the image to learn them
+            # The server's Content-Type covers formats we can't sniff (SVG, AVIF, ...)
+            media_type = content_type.split(";", 1)[0].strip().lower()
+            asset_to_insert.update(image_metadata(
+                image_data, media_type if media_type.startswith("image/") else None
+            ))
+            asset_to_insert.update(await asyncio.get_running_loop().run_in_executor(
+                IMAGE_EXECUTOR, build_preview, image_data, asset_to_insert.get("contentType", "")
+            ))
         logger.info(f"Prepared asset for insertion with fields: {list(asset_to_insert.keys())}")
         
         # Insert into database
         result = await asset_collection.insert_one(asset_to_insert)
         logger.info(f"Asset inserted with ID: {result.inserted_id}")
+        clear_local_cache()
         
-        created_asset = await asset_collection.find_one({"_id": result.inserted_id})
+        # The image and vectors are already in hand, don't read them back
+        created_asset = await asset_collection.find_one(
+            {"_id": result.inserted_id},
+            {"image_data": 0, "preview_data": 0, "description_vector": 0, "image_embedding": 0}
+        )
         
         if not created_asset:
             logger.warning(f"Could not retrieve newly created asset with ID: {result.inserted_id}")
@@ -122,14 +140,10 @@ async def save_asset_with_image(
                 "message": "Asset saved but not retrieved",
                 "description_vector": description_embedding
             }
-        serialized_asset = serialize_for_json(dict(created_asset))
-        
-        if "_id" in serialized_asset and "id" not in serialized_asset:
-            serialized_asset["id"] = serialized_asset["_id"]
+        serialized_asset = serialize_document(created_asset)
         
-        if "image_data" in serialized_asset:
-            serialized_asset["image_data_size"] = len(created_asset["image_data"])
-            del serialized_asset["image_data"]
+        if image_data:
+            serialized_asset["image_data_size"] = len(image_data)
         
         logger.info(f"Asset saved successfully with ID: {serialized_asset.get('id')}")
 
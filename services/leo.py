@@ -1,6 +1,4 @@
 import requests
-import os
-from dotenv import load_dotenv
 import logging
 from typing import Optional, Dict, Any
 import asyncio
@@ -9,11 +7,6 @@ from config import config
 
 logging.basicConfig(level=logging.DEBUG)
 
-try:
-    load_dotenv()
-except:
-    pass
-
 LEONARDO_API_BASE_URL = "https://cloud.leonardo.ai/api/rest/v1"
 LEONARDO_API_KEY = config.leonardo_api_key
 
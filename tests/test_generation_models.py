@@ -0,0 +1,58 @@
+import unittest
+import warnings
+from datetime import datetime, timezone
+
+from bson import ObjectId
+from pydantic import ValidationError
+
+from models.generation import (
+    Generation,
+    GenerationResponse,
+    GenerationSearchResult,
+    GENERATION_LIST_ADAPTER,
+    SEARCH_RESULT_LIST_ADAPTER,
+)
+
+
+def meshy_generation_doc() -> dict:
+    return {
+        "_id": ObjectId(),
+        "character_id": ObjectId(),
+        "created_at": datetime.now(timezone.utc),
+        "meshy": {
+            "meshy_id": "task-1",
+            "status": "completed",
+            "texture_urls": [{"base_color": "https://example.com/base.png"}],
+        },
+    }
+
+
+class MeshyGenerationDumpTest(unittest.TestCase):
+    def test_list_dump_of_mongo_doc_does_not_warn(self):
+        generation = GenerationResponse.from_mongo(meshy_generation_doc())
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            body = GENERATION_LIST_ADAPTER.dump_json([generation], by_alias=True)
+        self.assertIn(b'"texture_urls":[{"base_color":"https://example.com/base.png"}]', body)
+
+    def test_search_result_dump_does_not_warn(self):
+        result = GenerationSearchResult.model_construct(
+            generation=Generation.from_mongo(meshy_generation_doc()),
+            score=0.9,
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            body = SEARCH_RESULT_LIST_ADAPTER.dump_json([result], by_alias=True)
+        self.assertIn(b'"base_color":"https://example.com/base.png"', body)
+
+
+class FromMongoRequiredFieldsTest(unittest.TestCase):
+    def test_doc_missing_required_field_is_rejected(self):
+        doc = meshy_generation_doc()
+        del doc["character_id"]
+        with self.assertRaises(ValidationError):
+            GenerationResponse.from_mongo(doc)
+
+
+if __name__ == "__main__":
+    unittest.main()
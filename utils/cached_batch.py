@@ -2,31 +2,43 @@
 from fastapi import APIRouter
 from typing import Optional
 import logging
-from datetime import datetime, timedelta
-import hashlib
+from datetime import datetime, timedelta, timezone
+from cachetools import TTLCache
 
 router = APIRouter()
 logging.basicConfig(level=logging.INFO)
 
+# In-process layer in front of the MongoDB cache so hot pages skip the round-trip
+LOCAL_CACHE_MAXSIZE = 128
+LOCAL_CACHE_TTL_SECONDS = 300
+_local_cache: TTLCache = TTLCache(maxsize=LOCAL_CACHE_MAXSIZE, ttl=LOCAL_CACHE_TTL_SECONDS)
 
-def generate_cache_key(type_filter: Optional[str], page: int, page_size: int, image_quality: int, max_image_width: Optional[int]) -> str:
-    """Generate a cache key based on query parameters"""
-    params = f"{type_filter}_{page}_{page_size}_{image_quality}_{max_image_width}"
-    return hashlib.md5(params.encode()).hexdigest()
+
+def generate_cache_key(type_filter: Optional[str], page: int, page_size: int, image_quality: int, max_image_width: Optional[int], include_images: bool = True) -> str:
+    """
+    Generate a cache key based on query parameters. The type comes first so
+    a type's entries can be invalidated by prefix.
+    """
+    return f"{type_filter or '*'}|{page}|{page_size}|{image_quality}|{max_image_width or '*'}|{int(include_images)}"
 
 async def get_cached_batch(cache_key: str, cache_collection=None) -> Optional[dict]:
-    """Get cached batch from MongoDB cache collection"""
+    """Get cached batch from the in-process cache, falling back to MongoDB"""
     try:
+        cached = _local_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         if cache_collection is None:
             return None
         
         cached = await cache_collection.find_one({
             "cache_key": cache_key,
-            "expires_at": {"$gt": datetime.utcnow()}
+            "expires_at": {"$gt": datetime.now(timezone.utc)}
         })
         
         if cached:
             logging.info(f"Cache hit for key: {cache_key}")
+            _local_cache[cache_key] = cached.get("data")
             return cached.get("data")
         
         return None
@@ -35,21 +47,28 @@ async def get_cached_batch(cache_key: str, cache_collection=None) -> Optional[di
         return None
 
 async def set_cached_batch(cache_key: str, data: dict, ttl_hours: int = 24, cache_collection=None):
-    """Cache batch data in MongoDB with TTL"""
+    """Cache batch data in process and in MongoDB with TTL"""
     try:
+        _local_cache[cache_key] = data
+
         if cache_collection is None:
             return
         
+        now = datetime.now(timezone.utc)
         await cache_collection.replace_one(
             {"cache_key": cache_key},
             {
                 "cache_key": cache_key,
                 "data": data,
-                "created_at": datetime.utcnow(),
-                "expires_at": datetime.utcnow() + timedelta(hours=ttl_hours)
+                "created_at": now,
+                "expires_at": now + timedelta(hours=ttl_hours)
             },
             upsert=True
         )
         logging.info(f"Cached batch with key: {cache_key}")
     except Exception as e:
-        logging.warning(f"Cache storage error: {e}")
\ No newline at end of file
+        logging.warning(f"Cache storage error: {e}")
+
+def clear_local_cache():
+    """Drop all in-process cache entries, e.g. after assets change"""
+    _local_cache.clear()
@@ -0,0 +1,51 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+
+# Media that is already compressed; gzipping it costs CPU and saves nothing
+INCOMPRESSIBLE_PREFIXES = ("image/", "video/", "audio/")
+COMPRESSIBLE_EXCEPTIONS = frozenset({"image/svg+xml", "image/bmp"})
+INCOMPRESSIBLE_SUFFIXES = ("zip", "gzip")
+
+
+# Streamed line by line; gzip would hold the lines back in its buffer
+STREAMED_MEDIA_TYPES = frozenset({"application/x-ndjson"})
+
+
+def is_incompressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type in COMPRESSIBLE_EXCEPTIONS:
+        return False
+    return media_type.startswith(INCOMPRESSIBLE_PREFIXES) or media_type.endswith(INCOMPRESSIBLE_SUFFIXES)
+
+
+def skips_gzip(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type in STREAMED_MEDIA_TYPES or is_incompressible(media_type)
+
+
+class SelectiveGZipResponder(GZipResponder):
+    async def send_with_gzip(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            await super().send_with_gzip(message)
+            # Treat compressed media and streams like an already-encoded
+            # body, which the responder passes through untouched
+            if skips_gzip(Headers(raw=message["headers"]).get("content-type", "")):
+                self.content_encoding_set = True
+            return
+        await super().send_with_gzip(message)
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that skips already-compressed media and NDJSON streams"""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            if "gzip" in headers.get("Accept-Encoding", ""):
+                responder = SelectiveGZipResponder(
+                    self.app, self.minimum_size, compresslevel=self.compresslevel
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
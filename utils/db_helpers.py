@@ -1,11 +1,17 @@
 from bson import ObjectId
 from datetime import datetime
 
+# Exact types that pass through unchanged; most fields in a document are one
+# of these, so they skip the isinstance chain below
+_JSON_NATIVE = frozenset((str, int, float, bool, type(None)))
+
 def serialize_for_json(obj: dict) -> dict:
     """Convert MongoDB document to JSON-serializable dict"""
     result = {}
     for key, value in obj.items():
-        if isinstance(value, ObjectId):
+        if type(value) in _JSON_NATIVE:
+            result[key] = value
+        elif isinstance(value, ObjectId):
             result[key] = str(value)
         elif isinstance(value, datetime):
             result[key] = value.isoformat()
@@ -19,29 +25,23 @@ def serialize_for_json(obj: dict) -> dict:
             result[key] = value
     return result
 
+def serialize_document(doc: dict) -> dict:
+    """Serialize a MongoDB document and mirror its _id as id"""
+    serialized = serialize_for_json(doc)
+    if "_id" in serialized:
+        serialized.setdefault("id", serialized["_id"])
+    return serialized
+
 async def safe_find_one(collection, query):
     """
     Safely find a document and serialize it for JSON
     """
     result = await collection.find_one(query)
-    if result:
-        serialized = serialize_for_json(dict(result))
-        if "_id" in serialized and "id" not in serialized:
-            serialized["id"] = serialized["_id"]
-        return serialized
-    return None
+    return serialize_document(result) if result else None
 
 async def safe_find_many(collection, query, limit=1000):
     """
     Safely find multiple documents and serialize them for JSON
     """
     results = await collection.find(query).to_list(limit)
-    serialized_results = []
-    
-    for result in results:
-        serialized = serialize_for_json(dict(result))
-        if "_id" in serialized and "id" not in serialized:
-            serialized["id"] = serialized["_id"]
-        serialized_results.append(serialized)
-    
-    return serialized_results
\ No newline at end of file
+    return [serialize_document(result) for result in results]
@@ -0,0 +1,40 @@
+import hashlib
+import io
+from typing import Optional
+from PIL import Image
+
+
+def sniff_image_type(data: bytes, default: Optional[str] = "image/jpeg") -> Optional[str]:
+    """Detect an image MIME type from its leading magic bytes"""
+    if data[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    return default
+
+
+def image_metadata(data: bytes, content_type: Optional[str] = None) -> dict:
+    """
+    Describe stored image bytes for the asset document, so listings can show
+    type, size and dimensions without loading image_data. A content_type the
+    caller already knows wins over sniffing; contentType is omitted when
+    neither is available rather than guessed. Dimensions come from the
+    header only and are omitted if Pillow can't read it.
+    """
+    metadata = {
+        "image_size_bytes": len(data),
+        "image_sha256": hashlib.sha256(data).hexdigest(),
+    }
+    content_type = content_type or sniff_image_type(data, default=None)
+    if content_type:
+        metadata["contentType"] = content_type
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            metadata["image_width"], metadata["image_height"] = img.size
+    except Exception:
+        pass
+    return metadata
@@ -1,5 +1,4 @@
 from openai import OpenAI
-import os
 from typing import List, Optional
 from config import config
 import logging